@@ -1,20 +1,106 @@
 from __future__ import annotations
 
+import math
+import threading
 from abc import ABCMeta, abstractmethod
 from collections import defaultdict
 from collections.abc import Iterable as abc_Iterable
 from dataclasses import dataclass, field
-from typing import Any, Dict, FrozenSet, Iterable, Iterator, Optional, Set, Tuple, Union, cast
+from typing import Any, Callable, Dict, FrozenSet, Iterable, Iterator, Optional, Sequence, Tuple, TypeVar, Union
 
+import numpy as np
+from pint.errors import DimensionalityError
 from plenary import storage
 
-from gasify.unit import Quantity, dimensionless, parse, registry as unit_registry
+from gasify.unit import Quantity, TParseQuantity, dimensionless, parse, parse_magnitude, registry as unit_registry
+
+
+__all__ = [
+    'MONATOMIC',
+    'DIATOMIC',
+    'TRIATOMIC',
+    'POLYATOMIC',
+    'Compound',
+    'CompoundConcentration',
+    'Mixture',
+    'batch_gcf',
+    'nitrogen',
+    'oxygen',
+    'air',
+    'registry'
+]
+
+
+TCallable = TypeVar('TCallable', bound=Callable[..., Any])
+
+try:
+    from numba import njit as _njit
+
+    _HAS_NUMBA = True
+except ImportError:
+    _HAS_NUMBA = False
+
+    # numba is optional, kernels run as regular Python code when unavailable
+    def _njit(*args: Any, **kwargs: Any) -> Callable[[TCallable], TCallable]:
+        def decorator(func: TCallable) -> TCallable:
+            return func
+
+        return decorator
 
 
 _unit_specific_heat = unit_registry.cal / unit_registry.g
 _unit_density = unit_registry.g / unit_registry.L
 
 
+def _fast_parse(x: TParseQuantity) -> Quantity:
+    """ Parse input to a Quantity, skipping the general parser for Quantity and numeric inputs.
+
+    :param x: input str, number or Quantity
+    :return: parsed Quantity
+    """
+    if isinstance(x, Quantity):
+        return x
+    elif isinstance(x, (int, float)):
+        return Quantity(float(x), dimensionless)
+
+    return parse(x)
+
+
+@_njit(cache=True)
+def _gcf_kernel_loop(concentration: np.ndarray, gcf_terms: np.ndarray) -> float:
+    """ Calculate gas correction factor from component concentrations and their GCF terms.
+
+    :param concentration: component concentrations as fractions
+    :param gcf_terms: per-component molecular structure and density * specific heat
+    :return: gas correction factor, NaN if any component is missing GCF terms
+    """
+    # Concentration weighted sums of molecular structure and density * specific heat
+    structure = 0.0
+    density_specific_heat = 0.0
+
+    for n in range(concentration.shape[0]):
+        if np.isnan(gcf_terms[n, 0]) or np.isnan(gcf_terms[n, 1]):
+            return np.nan
+
+        structure += concentration[n] * gcf_terms[n, 0]
+        density_specific_heat += concentration[n] * gcf_terms[n, 1]
+
+    return 0.3106 * structure / density_specific_heat
+
+
+def _gcf_kernel_numpy(concentration: np.ndarray, gcf_terms: np.ndarray) -> float:
+    # Without numba a Python loop over array elements is far slower than vectorised numpy operations
+    if np.isnan(gcf_terms).any():
+        return np.nan
+
+    structure, density_specific_heat = concentration @ gcf_terms
+
+    return 0.3106 * structure / density_specific_heat
+
+
+_gcf_kernel = _gcf_kernel_loop if _HAS_NUMBA else _gcf_kernel_numpy
+
+
 class _GasRegistryEntry(storage.RegistryEntry, metaclass=ABCMeta):
     @property
     def analyte(self) -> bool:
@@ -45,7 +131,7 @@ class Compound(_GasRegistryEntry):
 
     # Gas chemical symbol and other names
     symbol: Optional[str] = field(default=None)
-    alias: FrozenSet[str] = field(default_factory=frozenset)
+    alias: Tuple[str, ...] = field(default=())
 
     molecular_structure: Optional[float] = field(default=None)
     specific_heat: Optional[Quantity] = field(default=None)
@@ -54,72 +140,95 @@ class Compound(_GasRegistryEntry):
     _analyte: bool = field(default=True)
     order: int = field(default=0)
 
+    # Cached GCF and its (molecular structure, density * specific heat) terms, calculated on creation
+    _gcf: Optional[float] = field(default=None, init=False, repr=False)
+    _gcf_terms: Optional[Tuple[float, float]] = field(default=None, init=False, repr=False)
+
+    # Cached hash and sort key
+    _hash: int = field(default=0, init=False, repr=False)
+    _sort_key: Tuple[int, str] = field(default=(0, ''), init=False, repr=False)
+
+    # Cached registry keys (name, symbol and aliases)
+    _registry_key: Tuple[str, ...] = field(default=(), init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        # Equality depends only on name, sort by order then name
+        object.__setattr__(self, '_hash', hash(self.name))
+        object.__setattr__(self, '_sort_key', (self.order, self.name))
+
+        if self.symbol is None:
+            object.__setattr__(self, '_registry_key', (self.name, *self.alias))
+        else:
+            object.__setattr__(self, '_registry_key', (self.name, self.symbol, *self.alias))
+
+        if self.molecular_structure is None or self.density is None or self.specific_heat is None:
+            # Unable to calculate GCF
+            return
+
+        density_specific_heat = parse_magnitude(self.density, _unit_density) * \
+            parse_magnitude(self.specific_heat, _unit_specific_heat)
+
+        object.__setattr__(self, '_gcf_terms', (self.molecular_structure, density_specific_heat))
+        object.__setattr__(self, '_gcf', 0.3106 * self.molecular_structure / density_specific_heat)
+
     @property
     def analyte(self) -> bool:
         return self._analyte
 
     @property
     def gcf(self) -> Optional[float]:
-        if self.molecular_structure is None or self.density is None or self.specific_heat is None:
-            # Unable to calculate GCF
-            return None
-
-        return cast(float, (0.3106 * self.molecular_structure / (self.density * self.specific_heat)).magnitude)
+        return self._gcf
 
     @property
     def registry_key(self) -> Union[str, Iterable[str]]:
-        key_set = {self.name}
-
-        if self.symbol is not None:
-            key_set.add(self.symbol)
-
-        key_set.update(self.alias)
-
-        return key_set
+        return self._registry_key
 
     def __mul__(self, other: Any) -> CompoundConcentration:
+        if isinstance(other, (int, float)) and other >= 0:
+            # Plain fractions need no parsing or validation
+            return CompoundConcentration._from_float(float(other), self)
+
         if isinstance(other, (int, float, str, Quantity)):
-            return CompoundConcentration(parse(other), self)
+            return CompoundConcentration(_fast_parse(other), self)
 
         return NotImplemented
 
     __rmul__ = __mul__
 
     def __hash__(self) -> int:
-        # Equality depends only on name
-        return hash(self.name)
+        return self._hash
 
     def __eq__(self, other: Any) -> bool:
+        if self is other:
+            # Registry compounds are shared instances, skip name comparison
+            return True
+
         if isinstance(other, self.__class__):
             return self.name == other.name
 
         return object.__eq__(self, other)
 
     def __lt__(self, other: Any) -> bool:
-        # Sort by order then name
         if isinstance(other, self.__class__):
-            return (self.order, self.name) < (other.order, other.name)
+            return self._sort_key < other._sort_key
 
         return NotImplemented
 
     def __le__(self, other: Any) -> bool:
-        # Sort by order then name
         if isinstance(other, self.__class__):
-            return (self.order, self.name) <= (other.order, other.name)
+            return self._sort_key <= other._sort_key
 
         return NotImplemented
 
     def __gt__(self, other: Any) -> bool:
-        # Sort by order then name
         if isinstance(other, self.__class__):
-            return (self.order, self.name) > (other.order, other.name)
+            return self._sort_key > other._sort_key
 
         return NotImplemented
 
     def __ge__(self, other: Any) -> bool:
-        # Sort by order then name
         if isinstance(other, self.__class__):
-            return (self.order, self.name) >= (other.order, other.name)
+            return self._sort_key >= other._sort_key
 
         return NotImplemented
 
@@ -135,15 +244,50 @@ class CompoundConcentration:
     concentration: Quantity
     compound: Compound
 
+    # Concentration magnitude as a fraction, avoids unit conversion in comparisons and mixture construction
+    _concentration_m: float = field(default=0.0, init=False, repr=False, compare=False)
+
     def __post_init__(self) -> None:
-        object.__setattr__(self, 'concentration', parse(self.concentration).to_compact())
+        concentration = _fast_parse(self.concentration)
+
+        if concentration._units == dimensionless._units:
+            # Plain fractions (including numeric input) are already valid and compact
+            concentration_m = float(concentration.magnitude)
+        else:
+            try:
+                concentration_m = concentration.m_as(dimensionless)
+            except DimensionalityError as ex:
+                raise ValueError('Gas concentration must be a dimensionless quantity') from ex
 
-        if not self.concentration.is_compatible_with(dimensionless):
-            raise ValueError('Gas concentration must be a dimensionless quantity')
+            if concentration_m > 0:
+                # Only scaled units (percent, ppm, etc.) need compacting, zero has no meaningful scale
+                concentration = concentration.to_compact()
 
-        if self.concentration.m_as(dimensionless) < 0:
+        object.__setattr__(self, 'concentration', concentration)
+        object.__setattr__(self, '_concentration_m', concentration_m)
+
+        if self._concentration_m < 0:
             raise ValueError('Gas concentration cannot be below zero')
 
+    @classmethod
+    def _from_float(cls, concentration_m: float, compound: Compound) -> CompoundConcentration:
+        """ Create from a fractional concentration magnitude, skipping parsing.
+
+        :param concentration_m: concentration as a non-negative fraction
+        :param compound: gas compound
+        :return: new CompoundConcentration
+        """
+        if not concentration_m >= 0:
+            # Also catches NaN
+            raise ValueError('Gas concentration cannot be below zero')
+
+        instance = object.__new__(cls)
+        object.__setattr__(instance, 'concentration', Quantity(concentration_m, dimensionless))
+        object.__setattr__(instance, 'compound', compound)
+        object.__setattr__(instance, '_concentration_m', concentration_m)
+
+        return instance
+
     def __add__(self, other: Any) -> Mixture:
         if isinstance(other, abc_Iterable):
             return Mixture(self, *other)
@@ -154,7 +298,7 @@ class CompoundConcentration:
 
     def __truediv__(self, other: Any) -> CompoundConcentration:
         if isinstance(other, (int, float, str, Quantity)):
-            return CompoundConcentration(self.concentration / parse(other), self.compound)
+            return CompoundConcentration(self.concentration / _fast_parse(other), self.compound)
 
         return NotImplemented
 
@@ -162,63 +306,62 @@ class CompoundConcentration:
         if not isinstance(other, (int, float, str, Quantity)):
             return NotImplemented
 
-        return CompoundConcentration(parse(other) * self.concentration, self.compound)
+        return CompoundConcentration(_fast_parse(other) * self.concentration, self.compound)
 
     __rmul__ = __mul__
 
     def __eq__(self, other: Any) -> bool:
         if isinstance(other, self.__class__):
             # Allow some error for floating point math, equates to less than 0.001 ppt
-            return self.compound == other.compound and abs(self.concentration.m_as(dimensionless) -
-                                                           other.concentration.m_as(dimensionless)) <= 1e-15
+            return self.compound == other.compound and abs(self._concentration_m - other._concentration_m) <= 1e-15
         elif isinstance(other, Compound):
             return self.compound == other
         elif isinstance(other, (int, float, str, Quantity)):
-            return bool(self.concentration == parse(other))
+            return bool(self.concentration == _fast_parse(other))
 
         return object.__eq__(self, other)
 
     def __lt__(self, other: Any) -> bool:
         if isinstance(other, self.__class__):
             if self.compound == other.compound:
-                return bool(self.concentration < other.concentration)
+                return self._concentration_m < other._concentration_m
             else:
                 return self.compound < other.compound
         elif isinstance(other, (int, float, str, Quantity)):
-            return bool(self.concentration < parse(other))
+            return bool(self.concentration < _fast_parse(other))
 
         return NotImplemented
 
     def __le__(self, other: Any) -> bool:
         if isinstance(other, self.__class__):
             if self.compound == other.compound:
-                return bool(self.concentration <= other.concentration)
+                return self._concentration_m <= other._concentration_m
             else:
                 return self.compound <= other.compound
         elif isinstance(other, (int, float, str, Quantity)):
-            return bool(self.concentration <= parse(other))
+            return bool(self.concentration <= _fast_parse(other))
 
         return NotImplemented
 
     def __gt__(self, other: Any) -> bool:
         if isinstance(other, self.__class__):
             if self.compound == other.compound:
-                return bool(self.concentration > other.concentration)
+                return self._concentration_m > other._concentration_m
             else:
                 return bool(self.compound > other.compound)
         elif isinstance(other, (int, float, str, Quantity)):
-            return bool(self.concentration > parse(other))
+            return bool(self.concentration > _fast_parse(other))
 
         return NotImplemented
 
     def __ge__(self, other: Any) -> bool:
         if isinstance(other, self.__class__):
             if self.compound == other.compound:
-                return bool(self.concentration >= other.concentration)
+                return self._concentration_m >= other._concentration_m
             else:
                 return bool(self.compound >= other.compound)
         elif isinstance(other, (int, float, str, Quantity)):
-            return bool(self.concentration >= parse(other))
+            return bool(self.concentration >= _fast_parse(other))
 
         return NotImplemented
 
@@ -233,29 +376,82 @@ class Mixture(_GasRegistryEntry):
     # Mixture name
     name: Optional[str] = field(default=None)
 
+    # Set of compounds present in mixture
+    _compounds: FrozenSet[Compound] = field(init=False, repr=False, compare=False)
+
+    # True if any component is an analyte
+    _analyte: bool = field(init=False, repr=False, compare=False)
+
+    # Component concentrations and GCF terms as arrays for gas correction factor calculation
+    _concentration: np.ndarray = field(init=False, repr=False, compare=False)
+    _gcf_terms: np.ndarray = field(init=False, repr=False, compare=False)
+
+    # Total concentration of all components, as a fraction and as a Quantity
+    _total_m: float = field(init=False, repr=False, compare=False)
+    _total: Quantity = field(init=False, repr=False, compare=False)
+
     def __init__(self, *content: CompoundConcentration, name: Optional[str] = None):
         # Combine parts by compound
         parts_lut: Dict[Compound, float] = defaultdict(float)
 
         for part in content:
-            parts_lut[part.compound] += part.concentration.m_as(dimensionless)
+            parts_lut[part.compound] += part._concentration_m
+
+        self._init_parts(parts_lut, name)
 
-        # Order components by concentration with non-analytes last
+    @classmethod
+    def _from_parts_lut(cls, parts_lut: Dict[Compound, float], name: Optional[str] = None) -> Mixture:
+        """ Create from concentrations already combined by compound, skipping aggregation of individual parts.
+
+        :param parts_lut: mapping of compound to concentration as a fraction
+        :param name: mixture name
+        :return: new Mixture
+        """
+        instance = object.__new__(cls)
+        instance._init_parts(parts_lut, name)
+
+        return instance
+
+    def _init_parts(self, parts_lut: Dict[Compound, float], name: Optional[str]) -> None:
+        # Order components by compound (order then name), compounds are unique after combining so no tie-break needed
         object.__setattr__(
             self,
             'content',
             tuple(
-                sorted(
-                    [
-                        CompoundConcentration(Quantity(concentration, dimensionless), compound)
-                        for compound, concentration in parts_lut.items()
-                    ]
-                )
+                CompoundConcentration._from_float(concentration, compound)
+                for compound, concentration in sorted(parts_lut.items(), key=lambda item: item[0]._sort_key)
             )
         )
         object.__setattr__(self, 'name', name)
+        object.__setattr__(self, '_compounds', frozenset(part.compound for part in self.content))
+        object.__setattr__(self, '_analyte', any(compound._analyte for compound in self._compounds))
+
+        object.__setattr__(
+            self,
+            '_concentration',
+            np.array([part._concentration_m for part in self.content], dtype=float)
+        )
+        object.__setattr__(
+            self,
+            '_gcf_terms',
+            np.array(
+                [part.compound._gcf_terms or (np.nan, np.nan) for part in self.content],
+                dtype=float
+            ).reshape(-1, 2)
+        )
+        object.__setattr__(self, '_total_m', math.fsum(self._concentration))
+        object.__setattr__(self, '_total', Quantity(self._total_m, dimensionless).to_compact())
 
     def __add__(self, other: Any) -> Mixture:
+        if isinstance(other, Mixture):
+            # Both mixtures are already combined by compound, merge directly
+            parts_lut = {part.compound: part._concentration_m for part in self.content}
+
+            for part in other.content:
+                parts_lut[part.compound] = parts_lut.get(part.compound, 0.0) + part._concentration_m
+
+            return Mixture._from_parts_lut(parts_lut)
+
         # Generate mixture from parts
         if isinstance(other, abc_Iterable):
             return Mixture(*self, *other)
@@ -272,51 +468,34 @@ class Mixture(_GasRegistryEntry):
 
     def __contains__(self, item: Any) -> bool:
         if isinstance(item, Compound):
-            return item in self.compounds
+            return item in self._compounds
         else:
             return item in self.content
 
     @property
     def analyte(self) -> bool:
-        return any(part.compound.analyte for part in self.content)
+        return self._analyte
 
     @property
-    def compounds(self) -> Set[Compound]:
-        return set(part.compound for part in self.content)
+    def compounds(self) -> FrozenSet[Compound]:
+        return self._compounds
 
     @property
     def gcf(self) -> float:
-        error_list = []
+        gcf = _gcf_kernel(self._concentration, self._gcf_terms)
 
-        for part in self.content:
-            if part.compound.gcf is None:
-                error_list.append(f"{part!s} missing properties")
+        if math.isnan(gcf):
+            error_list = [f"{part!s} missing properties" for part in self.content if part.compound.gcf is None]
 
-        if len(error_list) > 0:
             raise ValueError(f"Cannot calculate GCF, missing one or more properties of components: "
                              f"{', '.join(error_list)}")
 
-        return cast(
-            float,
-            (
-                0.3106
-                * sum(
-                    part.concentration * part.compound.molecular_structure
-                    for part in self.content
-                )
-                / sum(
-                    part.concentration * part.compound.density * part.compound.specific_heat
-                    for part in self.content
-                )
-            ).magnitude
-        )
+        return float(gcf)
 
     @property
     def total(self) -> Quantity:
-        return Quantity(
-            sum(part.concentration.m_as(dimensionless) for part in self.content),
-            dimensionless
-        ).to_compact()
+        # Return a copy as callers may modify the result in-place
+        return Quantity(self._total._magnitude, self._total._units)
 
     @property
     def registry_key(self) -> Union[str, Iterable[str]]:
@@ -329,21 +508,50 @@ class Mixture(_GasRegistryEntry):
         return ', '.join(map(str, self.content))
 
     def normalise(self) -> Mixture:
-        total = self.total
-
-        return Mixture(*(part / total for part in self.content), name=self.name)
+        return Mixture(
+            *(
+                CompoundConcentration._from_float(part._concentration_m / self._total_m, part.compound)
+                for part in self.content
+            ),
+            name=self.name
+        )
 
     @classmethod
     def auto_balance(cls, *content: CompoundConcentration, balance: Compound, name: Optional[str] = None) -> Mixture:
-        content_list = list(content)
-        balance_quantity = Quantity(1.0, dimensionless)
+        balance_m = 1.0 - sum(part._concentration_m for part in content)
 
-        for part in content:
-            balance_quantity -= part.concentration
+        if balance_m < 0:
+            raise ValueError(f"Cannot balance mixture, total concentration of components exceeds 100% by "
+                             f"{-balance_m:.3g}")
+
+        return Mixture(*content, CompoundConcentration._from_float(balance_m, balance), name=name)
+
+
+def batch_gcf(concentration: np.ndarray, compounds: Sequence[Compound]) -> np.ndarray:
+    """ Calculate gas correction factors for many mixtures of the same compounds at once.
+
+    :param concentration: 2D array of concentrations as fractions, one row per mixture and one column per compound
+    :param compounds: compounds corresponding to each column of concentration
+    :return: array of gas correction factors, one per mixture
+    """
+    concentration = np.asarray(concentration, dtype=float)
+
+    if concentration.ndim != 2 or concentration.shape[1] != len(compounds):
+        raise ValueError(f"Concentration must be a 2D array with {len(compounds)} columns")
+
+    error_list = [f"{compound!s} missing properties" for compound in compounds if compound._gcf_terms is None]
+
+    if len(error_list) > 0:
+        raise ValueError(f"Cannot calculate GCF, missing one or more properties of components: "
+                         f"{', '.join(error_list)}")
+
+    # Molecular structure and density * specific heat of each compound as columns
+    gcf_terms = np.array([compound._gcf_terms for compound in compounds], dtype=float).reshape(-1, 2)
 
-        content_list.append(CompoundConcentration(balance_quantity, balance))
+    # Concentration weighted sums for all mixtures in a single matrix product
+    structure, density_specific_heat = (concentration @ gcf_terms).T
 
-        return Mixture(*content_list, name=name)
+    return 0.3106 * structure / density_specific_heat
 
 
 nitrogen = Compound(
@@ -378,222 +586,267 @@ air = Mixture.auto_balance(
 
 # noinspection PyAbstractClass
 class _GasRegistry(storage.Registry[_GasRegistryEntry]):
-    pass
-
-
-registry = _GasRegistry([
-    Compound(
-        'Acetone',
-        symbol='(CH_3)_2CO',
-        molecular_structure=POLYATOMIC,
-        specific_heat=Quantity(0.51, _unit_specific_heat),
-        density=Quantity(0.21, _unit_density)
-    ),
-    Compound(
-        'Ammonia',
-        symbol='NH_3',
-        molecular_structure=POLYATOMIC,
-        specific_heat=Quantity(0.492, _unit_specific_heat),
-        density=Quantity(0.76, _unit_density)
-    ),
-    Compound(
-        'Argon',
-        symbol='Ar',
-        molecular_structure=MONATOMIC,
-        specific_heat=Quantity(0.1244, _unit_specific_heat),
-        density=Quantity(1.782, _unit_density),
-        _analyte=False,
-        order=2
-    ),
-    Compound(
-        'Arsine',
-        molecular_structure=POLYATOMIC,
-        specific_heat=Quantity(0.1167, _unit_specific_heat),
-        density=Quantity(3.478, _unit_density)
-    ),
-    Compound(
-        'Bromine',
-        symbol='Br_2',
-        molecular_structure=DIATOMIC,
-        specific_heat=Quantity(0.0539, _unit_specific_heat),
-        density=Quantity(7.13, _unit_density)
-    ),
-    Compound(
-        'Carbon-dioxide',
-        symbol='CO_2',
-        molecular_structure=TRIATOMIC,
-        specific_heat=Quantity(0.2016, _unit_specific_heat),
-        density=Quantity(1.964, _unit_density)
-    ),
-    Compound(
-        'Carbon-monoxide',
-        symbol='CO',
-        molecular_structure=DIATOMIC,
-        specific_heat=Quantity(0.2488, _unit_specific_heat),
-        density=Quantity(1.25, _unit_density)
-    ),
-    Compound(
-        'Carbon-tetrachloride',
-        molecular_structure=POLYATOMIC,
-        specific_heat=Quantity(0.1655, _unit_specific_heat),
-        density=Quantity(6.86, _unit_density)
-    ),
-    Compound(
-        'Carbon-tetraflouride',
-        molecular_structure=POLYATOMIC,
-        specific_heat=Quantity(0.1654, _unit_specific_heat),
-        density=Quantity(3.926, _unit_density)
-    ),
-    Compound(
-        'Chlorine',
-        symbol='Cl_2',
-        molecular_structure=DIATOMIC,
-        specific_heat=Quantity(0.1144, _unit_specific_heat),
-        density=Quantity(3.163, _unit_density)
-    ),
-    Compound(
-        'Cyanogen',
-        molecular_structure=POLYATOMIC,
-        specific_heat=Quantity(0.2613, _unit_specific_heat),
-        density=Quantity(2.322, _unit_density)
-    ),
-    Compound(
-        'Deuterium',
-        symbol='H_2/D_2',
-        molecular_structure=DIATOMIC,
-        specific_heat=Quantity(1.722, _unit_specific_heat),
-        density=Quantity(0.1799, _unit_density)
-    ),
-    Compound(
-        'Ethane',
-        symbol='C_2H_6',
-        molecular_structure=POLYATOMIC,
-        specific_heat=Quantity(0.4097, _unit_specific_heat),
-        density=Quantity(1.342, _unit_density)
-    ),
-    Compound(
-        'Fluorine',
-        symbol='F_2',
-        molecular_structure=DIATOMIC,
-        specific_heat=Quantity(0.1873, _unit_specific_heat),
-        density=Quantity(1.695, _unit_density)
-    ),
-    Compound(
-        'Helium',
-        symbol='He',
-        molecular_structure=MONATOMIC,
-        specific_heat=Quantity(1.241, _unit_specific_heat),
-        density=Quantity(0.1786, _unit_density),
-        _analyte=False,
-        order=2
-    ),
-    Compound(
-        'Hexane',
-        symbol='C_6H14',
-        molecular_structure=POLYATOMIC,
-        specific_heat=Quantity(0.54, _unit_specific_heat),
-        density=Quantity(0.672, _unit_density)
-    ),
-    Compound(
-        'Hydrogen',
-        symbol='H_2',
-        molecular_structure=DIATOMIC,
-        specific_heat=Quantity(3.3852, _unit_specific_heat),
-        density=Quantity(0.0899, _unit_density)
-    ),
-    Compound(
-        'Hydrogen-chloride',
-        symbol='HCl',
-        molecular_structure=DIATOMIC,
-        specific_heat=Quantity(0.1912, _unit_specific_heat),
-        density=Quantity(1.627, _unit_density)
-    ),
-    Compound(
-        'Hydrogen-fluoride',
-        symbol='HF',
-        molecular_structure=DIATOMIC,
-        specific_heat=Quantity(0.3479, _unit_specific_heat),
-        density=Quantity(0.893, _unit_density)
-    ),
-    Compound(
-        'Methane',
-        symbol='CH_4',
-        molecular_structure=POLYATOMIC,
-        specific_heat=Quantity(0.5223, _unit_specific_heat),
-        density=Quantity(0.716, _unit_density)
-    ),
-    Compound(
-        'Neon',
-        symbol='Ne',
-        molecular_structure=MONATOMIC,
-        specific_heat=Quantity(0.246, _unit_specific_heat),
-        density=Quantity(0.9, _unit_density),
-        _analyte=False,
-        order=2
-    ),
-    Compound(
-        'Nitric-oxide',
-        symbol='NO',
-        molecular_structure=DIATOMIC,
-        specific_heat=Quantity(0.2328, _unit_specific_heat),
-        density=Quantity(1.339, _unit_density)
-    ),
-    Compound(
-        'Nitric-oxides',
-        symbol='NO_x'
-    ),
-    Compound(
-        'Nitrogen-dioxide',
-        symbol='NO_2',
-        molecular_structure=TRIATOMIC,
-        specific_heat=Quantity(0.1933, _unit_specific_heat),
-        density=Quantity(2.052, _unit_density)
-    ),
-    Compound(
-        'Nitrous-oxide',
-        symbol='N_2O',
-        molecular_structure=TRIATOMIC,
-        specific_heat=Quantity(0.2088, _unit_specific_heat),
-        density=Quantity(1.964, _unit_density)
-    ),
-    Compound(
-        'Phosphine',
-        symbol='PH_3',
-        molecular_structure=POLYATOMIC,
-        specific_heat=Quantity(0.2374, _unit_specific_heat),
-        density=Quantity(1.517, _unit_density)
-    ),
-    Compound(
-        'Propane',
-        symbol='C_3H_8',
-        molecular_structure=POLYATOMIC,
-        specific_heat=Quantity(0.3885, _unit_specific_heat),
-        density=Quantity(1.967, _unit_density)
-    ),
-    Compound(
-        'Propylene',
-        symbol='C_3H_6',
-        molecular_structure=POLYATOMIC,
-        specific_heat=Quantity(0.3541, _unit_specific_heat),
-        density=Quantity(1.877, _unit_density)
-    ),
-    Compound(
-        'Sulfur hexaflouride',
-        symbol='SF_6',
-        molecular_structure=POLYATOMIC,
-        specific_heat=Quantity(0.1592, _unit_specific_heat),
-        density=Quantity(6.516, _unit_density)
-    ),
-    Compound(
-        'Xenon',
-        symbol='Xe',
-        molecular_structure=MONATOMIC,
-        specific_heat=Quantity(0.0378, _unit_specific_heat),
-        density=Quantity(5.858, _unit_density),
-        _analyte=False,
-        order=2
-    ),
-    nitrogen,
-    oxygen,
-    air
-])
+    def __init__(self, initial: Optional[Iterable[_GasRegistryEntry]] = None):
+        # Entries indexed by the exact key used to request them, skips key sanitisation on repeat lookups
+        self._lookup: Dict[Any, _GasRegistryEntry] = {}
+
+        super().__init__(initial)
+
+    def __getitem__(self, item: Any) -> _GasRegistryEntry:
+        try:
+            return self._lookup[item]
+        except (KeyError, TypeError):
+            pass
+
+        entry = super().__getitem__(item)
+
+        if isinstance(item, str):
+            self._lookup[item] = entry
+
+        return entry
+
+    def register(self, item: _GasRegistryEntry) -> None:
+        # New entries may replace existing keys
+        self._lookup.clear()
+
+        super().register(item)
+
+
+# Registry is populated on first access through module __getattr__
+registry: _GasRegistry
+_registry_lock = threading.Lock()
+
+
+def _build_registry() -> _GasRegistry:
+    return _GasRegistry([
+        Compound(
+            'Acetone',
+            symbol='(CH_3)_2CO',
+            molecular_structure=POLYATOMIC,
+            specific_heat=Quantity(0.51, _unit_specific_heat),
+            density=Quantity(0.21, _unit_density)
+        ),
+        Compound(
+            'Ammonia',
+            symbol='NH_3',
+            molecular_structure=POLYATOMIC,
+            specific_heat=Quantity(0.492, _unit_specific_heat),
+            density=Quantity(0.76, _unit_density)
+        ),
+        Compound(
+            'Argon',
+            symbol='Ar',
+            molecular_structure=MONATOMIC,
+            specific_heat=Quantity(0.1244, _unit_specific_heat),
+            density=Quantity(1.782, _unit_density),
+            _analyte=False,
+            order=2
+        ),
+        Compound(
+            'Arsine',
+            molecular_structure=POLYATOMIC,
+            specific_heat=Quantity(0.1167, _unit_specific_heat),
+            density=Quantity(3.478, _unit_density)
+        ),
+        Compound(
+            'Bromine',
+            symbol='Br_2',
+            molecular_structure=DIATOMIC,
+            specific_heat=Quantity(0.0539, _unit_specific_heat),
+            density=Quantity(7.13, _unit_density)
+        ),
+        Compound(
+            'Carbon-dioxide',
+            symbol='CO_2',
+            molecular_structure=TRIATOMIC,
+            specific_heat=Quantity(0.2016, _unit_specific_heat),
+            density=Quantity(1.964, _unit_density)
+        ),
+        Compound(
+            'Carbon-monoxide',
+            symbol='CO',
+            molecular_structure=DIATOMIC,
+            specific_heat=Quantity(0.2488, _unit_specific_heat),
+            density=Quantity(1.25, _unit_density)
+        ),
+        Compound(
+            'Carbon-tetrachloride',
+            molecular_structure=POLYATOMIC,
+            specific_heat=Quantity(0.1655, _unit_specific_heat),
+            density=Quantity(6.86, _unit_density)
+        ),
+        Compound(
+            'Carbon-tetraflouride',
+            molecular_structure=POLYATOMIC,
+            specific_heat=Quantity(0.1654, _unit_specific_heat),
+            density=Quantity(3.926, _unit_density)
+        ),
+        Compound(
+            'Chlorine',
+            symbol='Cl_2',
+            molecular_structure=DIATOMIC,
+            specific_heat=Quantity(0.1144, _unit_specific_heat),
+            density=Quantity(3.163, _unit_density)
+        ),
+        Compound(
+            'Cyanogen',
+            molecular_structure=POLYATOMIC,
+            specific_heat=Quantity(0.2613, _unit_specific_heat),
+            density=Quantity(2.322, _unit_density)
+        ),
+        Compound(
+            'Deuterium',
+            symbol='H_2/D_2',
+            molecular_structure=DIATOMIC,
+            specific_heat=Quantity(1.722, _unit_specific_heat),
+            density=Quantity(0.1799, _unit_density)
+        ),
+        Compound(
+            'Ethane',
+            symbol='C_2H_6',
+            molecular_structure=POLYATOMIC,
+            specific_heat=Quantity(0.4097, _unit_specific_heat),
+            density=Quantity(1.342, _unit_density)
+        ),
+        Compound(
+            'Fluorine',
+            symbol='F_2',
+            molecular_structure=DIATOMIC,
+            specific_heat=Quantity(0.1873, _unit_specific_heat),
+            density=Quantity(1.695, _unit_density)
+        ),
+        Compound(
+            'Helium',
+            symbol='He',
+            molecular_structure=MONATOMIC,
+            specific_heat=Quantity(1.241, _unit_specific_heat),
+            density=Quantity(0.1786, _unit_density),
+            _analyte=False,
+            order=2
+        ),
+        Compound(
+            'Hexane',
+            symbol='C_6H14',
+            molecular_structure=POLYATOMIC,
+            specific_heat=Quantity(0.54, _unit_specific_heat),
+            density=Quantity(0.672, _unit_density)
+        ),
+        Compound(
+            'Hydrogen',
+            symbol='H_2',
+            molecular_structure=DIATOMIC,
+            specific_heat=Quantity(3.3852, _unit_specific_heat),
+            density=Quantity(0.0899, _unit_density)
+        ),
+        Compound(
+            'Hydrogen-chloride',
+            symbol='HCl',
+            molecular_structure=DIATOMIC,
+            specific_heat=Quantity(0.1912, _unit_specific_heat),
+            density=Quantity(1.627, _unit_density)
+        ),
+        Compound(
+            'Hydrogen-fluoride',
+            symbol='HF',
+            molecular_structure=DIATOMIC,
+            specific_heat=Quantity(0.3479, _unit_specific_heat),
+            density=Quantity(0.893, _unit_density)
+        ),
+        Compound(
+            'Methane',
+            symbol='CH_4',
+            molecular_structure=POLYATOMIC,
+            specific_heat=Quantity(0.5223, _unit_specific_heat),
+            density=Quantity(0.716, _unit_density)
+        ),
+        Compound(
+            'Neon',
+            symbol='Ne',
+            molecular_structure=MONATOMIC,
+            specific_heat=Quantity(0.246, _unit_specific_heat),
+            density=Quantity(0.9, _unit_density),
+            _analyte=False,
+            order=2
+        ),
+        Compound(
+            'Nitric-oxide',
+            symbol='NO',
+            molecular_structure=DIATOMIC,
+            specific_heat=Quantity(0.2328, _unit_specific_heat),
+            density=Quantity(1.339, _unit_density)
+        ),
+        Compound(
+            'Nitric-oxides',
+            symbol='NO_x'
+        ),
+        Compound(
+            'Nitrogen-dioxide',
+            symbol='NO_2',
+            molecular_structure=TRIATOMIC,
+            specific_heat=Quantity(0.1933, _unit_specific_heat),
+            density=Quantity(2.052, _unit_density)
+        ),
+        Compound(
+            'Nitrous-oxide',
+            symbol='N_2O',
+            molecular_structure=TRIATOMIC,
+            specific_heat=Quantity(0.2088, _unit_specific_heat),
+            density=Quantity(1.964, _unit_density)
+        ),
+        Compound(
+            'Phosphine',
+            symbol='PH_3',
+            molecular_structure=POLYATOMIC,
+            specific_heat=Quantity(0.2374, _unit_specific_heat),
+            density=Quantity(1.517, _unit_density)
+        ),
+        Compound(
+            'Propane',
+            symbol='C_3H_8',
+            molecular_structure=POLYATOMIC,
+            specific_heat=Quantity(0.3885, _unit_specific_heat),
+            density=Quantity(1.967, _unit_density)
+        ),
+        Compound(
+            'Propylene',
+            symbol='C_3H_6',
+            molecular_structure=POLYATOMIC,
+            specific_heat=Quantity(0.3541, _unit_specific_heat),
+            density=Quantity(1.877, _unit_density)
+        ),
+        Compound(
+            'Sulfur hexaflouride',
+            symbol='SF_6',
+            molecular_structure=POLYATOMIC,
+            specific_heat=Quantity(0.1592, _unit_specific_heat),
+            density=Quantity(6.516, _unit_density)
+        ),
+        Compound(
+            'Xenon',
+            symbol='Xe',
+            molecular_structure=MONATOMIC,
+            specific_heat=Quantity(0.0378, _unit_specific_heat),
+            density=Quantity(5.858, _unit_density),
+            _analyte=False,
+            order=2
+        ),
+        nitrogen,
+        oxygen,
+        air
+    ])
+
+
+def __getattr__(name: str) -> Any:
+    if name == 'registry':
+        with _registry_lock:
+            # Another thread may have built the registry while waiting for the lock
+            if 'registry' not in globals():
+                globals()['registry'] = _build_registry()
+
+        return globals()['registry']
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> Iterable[str]:
+    return sorted(set(globals()) | {'registry'})
@@ -1,10 +1,26 @@
+import functools
 import math
 import warnings
-from typing import Callable, Optional, cast
+from typing import Any, Callable, Dict, Optional, TypeVar, Union, cast
+
+import numpy as np
 
 from gasify.unit import Quantity, Unit, registry, dimensionless, parse, TParseQuantity
 
 
+TCallable = TypeVar('TCallable', bound=Callable[..., Any])
+
+try:
+    from numba import njit as _njit
+except ImportError:
+    # numba is optional, kernels run as regular numpy code when unavailable
+    def _njit(*args: Any, **kwargs: Any) -> Callable[[TCallable], TCallable]:
+        def decorator(func: TCallable) -> TCallable:
+            return func
+
+        return decorator
+
+
 WATER_GAS_CONSTANT: Quantity = Quantity(0.4615, registry.J / (registry.gram * registry.degK))
 
 WATER_PRESSURE_CRITICAL: Quantity = Quantity(22.064, registry.MPa)
@@ -16,18 +32,137 @@ WATER_TEMPERATURE_CRITICAL: Quantity = Quantity(647.096, registry.degK)
 unit_absolute: Unit = registry.g / pow(registry.meter, 3)
 unit_relative: Unit = registry.percent
 
-TWaterVPCallable = Callable[[TParseQuantity], Quantity]
+# Frequently used units resolved once, registry attribute access parses the unit name on every call
+_UNIT_DEGC = registry.degC
+_UNIT_PA = registry.Pa
+
+# Offset between Celsius and Kelvin scales
+_DEGC_OFFSET = 273.15
+
+# Constants as plain floats to avoid per-call unit conversion and comparison
+_WATER_PRESSURE_CRITICAL_PA = WATER_PRESSURE_CRITICAL.m_as(_UNIT_PA)
+
+_WATER_TEMPERATURE_BOIL_C = WATER_TEMPERATURE_BOIL.m_as(_UNIT_DEGC)
+_WATER_TEMPERATURE_CRITICAL_K = WATER_TEMPERATURE_CRITICAL.m_as(registry.degK)
+
+TMagnitude = Union[float, np.ndarray]
+TParseQuantityArray = Union[TParseQuantity, np.ndarray]
+TWaterVPCallable = Callable[[TParseQuantityArray], Quantity]
 
 
 class TemperatureRangeWarning(UserWarning):
     pass
 
 
-def _wvps_vartheta(temperature: Quantity) -> Quantity:
-    return cast(Quantity, 1 - temperature / WATER_TEMPERATURE_CRITICAL)
+# Global toggle for temperature range checks in saturation pressure methods
+_range_warnings_enabled = True
+
+
+def set_range_warnings(enabled: bool) -> None:
+    """ Enable or disable temperature range checks in saturation pressure methods. When disabled no
+    TemperatureRangeWarning is raised and the checks are skipped entirely.
+
+    :param enabled: if True range checks are performed
+    """
+    global _range_warnings_enabled
+    _range_warnings_enabled = enabled
+
+
+def _as_magnitude(x: TParseQuantityArray, to_unit: Unit) -> TMagnitude:
+    """ Parse input and return its magnitude in the specified unit, preserving array inputs.
+
+    :param x: input str, number, array or Quantity, bare numbers and arrays are assumed to be in to_unit
+    :param to_unit: Unit to convert parsed values to
+    :return: float or array magnitude
+    """
+    if isinstance(x, (float, int)):
+        # Scalar fast path, skips Quantity construction in tight loops
+        return float(x)
+
+    if isinstance(x, np.ndarray):
+        return x.astype(float)
+
+    return parse(x, to_unit).magnitude
+
+
+def _as_magnitude_degC(temperature: TParseQuantityArray) -> TMagnitude:
+    return _as_magnitude(temperature, _UNIT_DEGC)
+
+
+def _range_check(name: str, lower: Quantity, upper: Quantity) -> Callable[[TCallable], TCallable]:
+    """ Create decorator that warns when temperatures passed to a saturation pressure method are out of range.
+
+    :param name: method name for warning messages
+    :param lower: minimum suitable temperature
+    :param upper: maximum suitable temperature
+    :return: decorator for methods accepting a temperature magnitude in degrees Celsius
+    """
+    lower_m = lower.m_as(_UNIT_DEGC)
+    upper_m = upper.m_as(_UNIT_DEGC)
+
+    def decorator(func: TCallable) -> TCallable:
+        @functools.wraps(func)
+        def wrapper(temperature_m: TMagnitude) -> TMagnitude:
+            if not _range_warnings_enabled:
+                return func(temperature_m)
+
+            if isinstance(temperature_m, float):
+                # Avoid numpy reductions for scalars
+                below = temperature_m < lower_m
+                above = temperature_m > upper_m
+            else:
+                below = np.any(temperature_m < lower_m)
+                above = np.any(temperature_m > upper_m)
+
+            if below:
+                warnings.warn(f"{name} method not suitable for calculations below {lower!s}", TemperatureRangeWarning)
+            elif above:
+                warnings.warn(f"{name} method not suitable for calculations above {upper!s}", TemperatureRangeWarning)
+
+            return func(temperature_m)
+
+        return cast(TCallable, wrapper)
+
+    return decorator
+
+
+# Unit conversion factors for float cores
+_PA_PER_MMHG = Quantity(1.0, registry.mmHg).m_as(_UNIT_PA)
+_PA_PER_KPA = 1e3
+
+
+@_njit(cache=True)
+def _wagner_pruss_kernel(temperature_m: TMagnitude) -> TMagnitude:
+    temperature_k = temperature_m + _DEGC_OFFSET
+    vartheta = 1.0 - temperature_k / _WATER_TEMPERATURE_CRITICAL_K
+
+    # Fractional powers evaluated from a shared logarithm
+    vartheta_log = np.log(vartheta)
+    vartheta_2 = vartheta * vartheta
+
+    return _WATER_PRESSURE_CRITICAL_PA * np.exp(
+        _WATER_TEMPERATURE_CRITICAL_K / temperature_k * (
+            -7.85951783 * vartheta +
+            1.84408259 * np.exp(vartheta_log * 1.5) +
+            -11.78649 * vartheta_2 * vartheta +
+            22.6807411 * np.exp(vartheta_log * 3.5) +
+            -15.9618719 * vartheta_2 * vartheta_2 +
+            1.80122502 * np.exp(vartheta_log * 7.5)
+        )
+    )
+
+
+def _water_vp_sat_wagner_pruss_pa(temperature_m: TMagnitude) -> TMagnitude:
+    if isinstance(temperature_m, float) and temperature_m + _DEGC_OFFSET < _WATER_TEMPERATURE_CRITICAL_K:
+        # Logarithm is always defined below the critical point, skip error state handling for scalars
+        return _wagner_pruss_kernel(temperature_m)
 
+    # log(0) at the critical point yields a zero term
+    with np.errstate(divide='ignore'):
+        return _wagner_pruss_kernel(temperature_m)
 
-def water_vp_sat_wagner_pruss(temperature: TParseQuantity) -> Quantity:
+
+def water_vp_sat_wagner_pruss(temperature: TParseQuantityArray) -> Quantity:
     """ Calculate saturation vapor pressure of water at given temperature using Wagner and Pruss (1993) method.
 
     Reference: https://doi.org/10.1063/1.1461829
@@ -35,23 +170,24 @@ def water_vp_sat_wagner_pruss(temperature: TParseQuantity) -> Quantity:
     :param temperature: gas temperature
     :return: saturation vapor pressure Quantity
     """
-    temperature = parse(temperature, registry.degC)
+    return Quantity(_water_vp_sat_wagner_pruss_pa(_as_magnitude_degC(temperature)), _UNIT_PA)
+
+
+_WATER_VP_SAT_SIMPLE_MIN = Quantity(0, _UNIT_DEGC)
+
 
-    # noinspection PyTypeChecker
-    return cast(Quantity, WATER_PRESSURE_CRITICAL * math.exp(WATER_TEMPERATURE_CRITICAL / temperature * (
-        -7.85951783 * _wvps_vartheta(temperature) +
-        1.84408259 * math.pow(_wvps_vartheta(temperature), 1.5) +
-        -11.78649 * math.pow(_wvps_vartheta(temperature), 3) +
-        22.6807411 * math.pow(_wvps_vartheta(temperature), 3.5) +
-        -15.9618719 * math.pow(_wvps_vartheta(temperature), 4) +
-        1.80122502 * math.pow(_wvps_vartheta(temperature), 7.5)
-    )))
+# Simple method coefficients, output scaling folded into the exponent
+_SIMPLE_A = 20.386 + math.log(_PA_PER_MMHG)
+_SIMPLE_B = 5132.0
 
 
-_WATER_VP_SAT_SIMPLE_MIN = Quantity(0, registry.degC)
+@_range_check('Simple', _WATER_VP_SAT_SIMPLE_MIN, WATER_TEMPERATURE_CRITICAL)
+@_njit(cache=True)
+def _water_vp_sat_simple_pa(temperature_m: TMagnitude) -> TMagnitude:
+    return np.exp(_SIMPLE_A - _SIMPLE_B / (temperature_m + _DEGC_OFFSET))
 
 
-def water_vp_sat_simple(temperature: TParseQuantity) -> Quantity:
+def water_vp_sat_simple(temperature: TParseQuantityArray) -> Quantity:
     """ Calculate saturation vapor pressure of water at given temperature using the simple method.
 
     Reference: https://www.omnicalculator.com/chemistry/vapour-pressure-of-water
@@ -59,19 +195,28 @@ def water_vp_sat_simple(temperature: TParseQuantity) -> Quantity:
     :param temperature: gas temperature
     :return: saturation vapor pressure Quantity
     """
-    if temperature < _WATER_VP_SAT_SIMPLE_MIN:
-        warnings.warn(f"Simple method not suitable for calculations below {_WATER_VP_SAT_SIMPLE_MIN!s}",
-                      TemperatureRangeWarning)
-    elif temperature > WATER_TEMPERATURE_CRITICAL:
-        warnings.warn('Simple method not suitable for calculations above critical temperature',
-                      TemperatureRangeWarning)
+    return Quantity(_water_vp_sat_simple_pa(_as_magnitude_degC(temperature)), _UNIT_PA)
 
-    temperature = parse(temperature, registry.degC)
 
-    return Quantity(math.exp(20.386 - (5132 / temperature.m_as(registry.degK))), registry.mmHg)
+# Antoine coefficients are base 10, evaluated via exp
+_LN10 = math.log(10.0)
 
 
-def water_vp_sat_antoine(temperature: TParseQuantity) -> Quantity:
+@_range_check('Antoine', WATER_TEMPERATURE_FREEZE, WATER_TEMPERATURE_CRITICAL)
+@_njit(cache=True)
+def _water_vp_sat_antoine_pa(temperature_m: TMagnitude) -> TMagnitude:
+    # Coefficients switch above boiling point, selected arithmetically so scalars avoid array allocation
+    above_boil = temperature_m > _WATER_TEMPERATURE_BOIL_C
+    below_boil = 1 - above_boil
+
+    a = 8.14019 * above_boil + 8.07131 * below_boil
+    b = 1810.94 * above_boil + 1730.63 * below_boil
+    c = 244.485 * above_boil + 233.426 * below_boil
+
+    return _PA_PER_MMHG * np.exp(_LN10 * (a - (b / (c + temperature_m))))
+
+
+def water_vp_sat_antoine(temperature: TParseQuantityArray) -> Quantity:
     """ Calculate saturation vapor pressure of water at given temperature using the Antoine method.
 
     Reference: https://www.omnicalculator.com/chemistry/vapour-pressure-of-water
@@ -79,31 +224,25 @@ def water_vp_sat_antoine(temperature: TParseQuantity) -> Quantity:
     :param temperature: gas temperature
     :return: saturation vapor pressure Quantity
     """
-    temperature = parse(temperature, registry.degC)
+    return Quantity(_water_vp_sat_antoine_pa(_as_magnitude_degC(temperature)), _UNIT_PA)
 
-    if temperature < WATER_TEMPERATURE_FREEZE:
-        warnings.warn(f"Antoine method not suitable for calculations below {WATER_TEMPERATURE_FREEZE!s}",
-                      TemperatureRangeWarning)
-    elif temperature > WATER_TEMPERATURE_CRITICAL:
-        warnings.warn('Antoine method not suitable for calculations above critical temperature',
-                      TemperatureRangeWarning)
 
-    if temperature > WATER_TEMPERATURE_BOIL:
-        a = 8.14019
-        b = 1810.94
-        c = 244.485
-    else:
-        a = 8.07131
-        b = 1730.63
-        c = 233.426
+_WATER_VP_SAT_SIMPLE_MAX = Quantity(100, _UNIT_DEGC)
 
-    return Quantity(math.pow(10.0, a - (b / (c + temperature.m_as(registry.degC)))), registry.mmHg)
 
+# Magnus method coefficients, output scaling folded into the leading term
+_MAGNUS_C = 0.61094 * _PA_PER_KPA
+_MAGNUS_A = 17.625
+_MAGNUS_B = 243.04
 
-_WATER_VP_SAT_SIMPLE_MAX = Quantity(100, registry.degC)
 
+@_range_check('Magnus', WATER_TEMPERATURE_FREEZE, _WATER_VP_SAT_SIMPLE_MAX)
+@_njit(cache=True)
+def _water_vp_sat_magnus_pa(temperature_m: TMagnitude) -> TMagnitude:
+    return _MAGNUS_C * np.exp(_MAGNUS_A * temperature_m / (temperature_m + _MAGNUS_B))
 
-def water_vp_sat_magnus(temperature: TParseQuantity) -> Quantity:
+
+def water_vp_sat_magnus(temperature: TParseQuantityArray) -> Quantity:
     """ Calculate saturation vapor pressure of water at given temperature using the
     Magnus/August-Roche-Magnus/Magnus-Tetens method.
 
@@ -112,25 +251,25 @@ def water_vp_sat_magnus(temperature: TParseQuantity) -> Quantity:
     :param temperature: gas temperature
     :return: saturation vapor pressure Quantity
     """
-    temperature = parse(temperature, registry.degC)
+    return Quantity(_water_vp_sat_magnus_pa(_as_magnitude_degC(temperature)), _UNIT_PA)
 
-    if temperature < WATER_TEMPERATURE_FREEZE:
-        warnings.warn(f"Magnus method not suitable for calculations below {WATER_TEMPERATURE_FREEZE!s}",
-                      TemperatureRangeWarning)
-    elif temperature > _WATER_VP_SAT_SIMPLE_MAX:
-        warnings.warn(f"Magnus method not suitable for calculations above {_WATER_VP_SAT_SIMPLE_MAX!s}",
-                      TemperatureRangeWarning)
 
-    return Quantity(
-        0.61094 * math.exp(17.625 * temperature.m_as(registry.degC) / (temperature.m_as(registry.degC) + 243.04)),
-        registry.kPa
-    )
+_WATER_VP_SAT_TENTENS_MAX = Quantity(75, _UNIT_DEGC)
+
 
+# Tetens method coefficients, output scaling folded into the leading term
+_TETENS_C = 0.61078 * _PA_PER_KPA
+_TETENS_A = 17.27
+_TETENS_B = 237.3
 
-_WATER_VP_SAT_TENTENS_MAX = Quantity(75, registry.degC)
 
+@_range_check('Tetens', WATER_TEMPERATURE_FREEZE, _WATER_VP_SAT_TENTENS_MAX)
+@_njit(cache=True)
+def _water_vp_sat_tetens_pa(temperature_m: TMagnitude) -> TMagnitude:
+    return _TETENS_C * np.exp(_TETENS_A * temperature_m / (temperature_m + _TETENS_B))
 
-def water_vp_sat_tetens(temperature: TParseQuantity) -> Quantity:
+
+def water_vp_sat_tetens(temperature: TParseQuantityArray) -> Quantity:
     """
 
     Reference: https://www.omnicalculator.com/chemistry/vapour-pressure-of-water
@@ -138,22 +277,23 @@ def water_vp_sat_tetens(temperature: TParseQuantity) -> Quantity:
     :param temperature: gas temperature
     :return: saturation vapor pressure Quantity
     """
-    temperature = parse(temperature, registry.degC)
+    return Quantity(_water_vp_sat_tetens_pa(_as_magnitude_degC(temperature)), _UNIT_PA)
 
-    if temperature < WATER_TEMPERATURE_FREEZE:
-        warnings.warn(f"Tetens method not suitable for calculations below {WATER_TEMPERATURE_FREEZE!s}",
-                      TemperatureRangeWarning)
-    elif temperature > _WATER_VP_SAT_TENTENS_MAX:
-        warnings.warn(f"Tetens method not suitable for calculations above {_WATER_VP_SAT_TENTENS_MAX!s}",
-                      TemperatureRangeWarning)
 
-    return Quantity(
-        0.61078 * math.exp((17.27 * temperature.m_as(registry.degC)) / (temperature.m_as(registry.degC) + 237.3)),
-        registry.kPa
-    )
+# Buck method coefficients, output scaling folded into the leading term and divisor replaced by its reciprocal
+_BUCK_C = 0.61121 * _PA_PER_KPA
+_BUCK_A = 18.678
+_BUCK_D_INV = 1.0 / 234.5
+_BUCK_B = 257.14
+
 
+@_range_check('Buck', WATER_TEMPERATURE_FREEZE, _WATER_VP_SAT_TENTENS_MAX)
+@_njit(cache=True)
+def _water_vp_sat_buck_pa(temperature_m: TMagnitude) -> TMagnitude:
+    return _BUCK_C * np.exp((_BUCK_A - temperature_m * _BUCK_D_INV) * temperature_m / (_BUCK_B + temperature_m))
 
-def water_vp_sat_buck(temperature: TParseQuantity) -> Quantity:
+
+def water_vp_sat_buck(temperature: TParseQuantityArray) -> Quantity:
     """
 
     Reference: https://www.omnicalculator.com/chemistry/vapour-pressure-of-water
@@ -161,58 +301,104 @@ def water_vp_sat_buck(temperature: TParseQuantity) -> Quantity:
     :param temperature: gas temperature
     :return: saturation vapor pressure Quantity
     """
-    temperature = parse(temperature, registry.degC)
+    return Quantity(_water_vp_sat_buck_pa(_as_magnitude_degC(temperature)), _UNIT_PA)
 
-    if temperature < WATER_TEMPERATURE_FREEZE:
-        warnings.warn(f"Buck method not suitable for calculations below {WATER_TEMPERATURE_FREEZE!s}",
-                      TemperatureRangeWarning)
-    elif temperature > _WATER_VP_SAT_TENTENS_MAX:
-        warnings.warn(f"Buck method not suitable for calculations above {_WATER_VP_SAT_TENTENS_MAX!s}",
-                      TemperatureRangeWarning)
 
-    temperature_m = temperature.m_as(registry.degC)
+_WATER_VP_SAT_TWO_POLE_MIN = Quantity(-40, _UNIT_DEGC)
 
-    return Quantity(
-        0.61121 * math.exp((18.678 - (temperature_m / 234.5)) * (temperature_m / (257.14 + temperature_m))),
-        registry.kPa
+
+# Two-pole fit coefficients, hPa to Pa scaling folded into the constant term
+_TWO_POLE_E = 1.810270925564 + math.log(100.0)
+_TWO_POLE_A = 269.265582773152
+_TWO_POLE_B = 323.238664916362
+_TWO_POLE_C = -253.834491723435
+_TWO_POLE_D = 333.837330281331
+
+
+@_range_check('Two-pole', _WATER_VP_SAT_TWO_POLE_MIN, _WATER_VP_SAT_SIMPLE_MAX)
+@_njit(cache=True)
+def _water_vp_sat_two_pole_pa(temperature_m: TMagnitude) -> TMagnitude:
+    return np.exp(
+        _TWO_POLE_E + _TWO_POLE_A * temperature_m / (_TWO_POLE_B + temperature_m) +
+        _TWO_POLE_C * temperature_m / (_TWO_POLE_D + temperature_m)
     )
 
 
-def absolute_to_relative(absolute_humidity: TParseQuantity, temperature: TParseQuantity,
+def water_vp_sat_two_pole(temperature: TParseQuantityArray) -> Quantity:
+    """ Calculate saturation vapor pressure of water at given temperature using a two-pole fit of the form
+    ln(p) = E + A t / (B + t) + C t / (D + t). Valid between -40 and 100 °C, within 0.05% of Wagner-Pruss from 0 to
+    100 °C with the error growing to -0.38% at -40 °C.
+
+    :param temperature: gas temperature
+    :return: saturation vapor pressure Quantity
+    """
+    return Quantity(_water_vp_sat_two_pole_pa(_as_magnitude_degC(temperature)), _UNIT_PA)
+
+
+# Float cores of the public saturation methods, allows conversions to skip Quantity wrapping
+_WATER_VP_SAT_PA: Dict[TWaterVPCallable, Callable[[TMagnitude], TMagnitude]] = {
+    water_vp_sat_wagner_pruss: _water_vp_sat_wagner_pruss_pa,
+    water_vp_sat_simple: _water_vp_sat_simple_pa,
+    water_vp_sat_antoine: _water_vp_sat_antoine_pa,
+    water_vp_sat_magnus: _water_vp_sat_magnus_pa,
+    water_vp_sat_tetens: _water_vp_sat_tetens_pa,
+    water_vp_sat_buck: _water_vp_sat_buck_pa,
+    water_vp_sat_two_pole: _water_vp_sat_two_pole_pa
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _pa_per_unit(units: Unit) -> float:
+    # Pressure units are multiplicative so a single factor per unit can be reused
+    return Quantity(1.0, units).m_as(_UNIT_PA)
+
+
+def _water_vp_sat_pa(temperature_m: TMagnitude, water_vp_method: Optional[TWaterVPCallable]) -> TMagnitude:
+    if water_vp_method is None:
+        return _water_vp_sat_wagner_pruss_pa(temperature_m)
+
+    if water_vp_method in _WATER_VP_SAT_PA:
+        return _WATER_VP_SAT_PA[water_vp_method](temperature_m)
+
+    # User provided method
+    pressure = water_vp_method(Quantity(temperature_m, _UNIT_DEGC))
+
+    return pressure.magnitude * _pa_per_unit(pressure.units)
+
+
+def absolute_to_relative(absolute_humidity: TParseQuantityArray, temperature: TParseQuantityArray,
                          water_vp_method: Optional[TWaterVPCallable] = None) -> Quantity:
     """ Convert absolute water vapour concentration (g/m^3) to relative humidity (%) at a given temperature.
 
-    :param absolute_humidity: absolute humidity concentration quantity
+    :param absolute_humidity: absolute humidity concentration quantity, arrays are broadcast against temperature
     :param temperature: gas temperature
     :param water_vp_method: method for water vapour saturation pressure calculation, defaults to Wagner-Pruss
     :return: relative humidity quantity
     """
-    absolute_humidity = parse(absolute_humidity, unit_absolute)
-    temperature = parse(temperature, registry.degC)
-    water_vp_method = water_vp_method or water_vp_sat_wagner_pruss
+    absolute_humidity_m = _as_magnitude(absolute_humidity, unit_absolute)
+    temperature_m = _as_magnitude_degC(temperature)
 
     return cast(Quantity, Quantity(
-        WATER_GAS_CONSTANT.magnitude * temperature.m_as(registry.degK) * absolute_humidity.m_as(unit_absolute) /
-        water_vp_method(temperature).m_as(registry.Pa),
+        WATER_GAS_CONSTANT.magnitude * (temperature_m + _DEGC_OFFSET) * absolute_humidity_m /
+        _water_vp_sat_pa(temperature_m, water_vp_method),
         dimensionless
     ).to(unit_relative))
 
 
-def relative_to_absolute(relative_humidity: TParseQuantity, temperature: TParseQuantity,
+def relative_to_absolute(relative_humidity: TParseQuantityArray, temperature: TParseQuantityArray,
                          water_vp_method: Optional[TWaterVPCallable] = None) -> Quantity:
     """ Convert relative humidity (%) to an absolute water vapour concentration (g/m^3) at a given temperature.
 
-    :param relative_humidity: relative humidity quantity
+    :param relative_humidity: relative humidity quantity, arrays are broadcast against temperature
     :param temperature: gas temperature
     :param water_vp_method: method for water vapour saturation pressure calculation, defaults to Wagner-Pruss
     :return: absolute humidity concentration quantity
     """
-    relative_humidity = parse(relative_humidity, dimensionless)
-    temperature = parse(temperature, registry.degC)
-    water_vp_method = water_vp_method or water_vp_sat_wagner_pruss
+    relative_humidity_m = _as_magnitude(relative_humidity, dimensionless)
+    temperature_m = _as_magnitude_degC(temperature)
 
     return Quantity(
-        relative_humidity.m_as(dimensionless) * water_vp_method(temperature).m_as(registry.Pa) / (
-                    WATER_GAS_CONSTANT.magnitude * temperature.m_as(registry.degK)),
+        relative_humidity_m * _water_vp_sat_pa(temperature_m, water_vp_method) / (
+            WATER_GAS_CONSTANT.magnitude * (temperature_m + _DEGC_OFFSET)),
         unit_absolute
     )
@@ -1,12 +1,14 @@
 from __future__ import annotations
 
 import functools
+import math
 import typing
 from datetime import timedelta
 
 import pint
 import pint.formatting
 import pint.registry
+import pint.util
 
 
 __all__ = [
@@ -67,9 +69,18 @@ class ParseError(UnitError, ValueError):
     pass
 
 
+# Translation for single character symbols
+_SYMBOL_TABLE = str.maketrans({'μ': 'u'})
+
+
 # Handler for percent sign and micro symbol
 def _handle_symbols(x: str) -> str:
-    return x.replace('%', ' percent ').replace('μ', 'u')
+    x = x.translate(_SYMBOL_TABLE)
+
+    if '%' in x:
+        return x.replace('%', ' percent ')
+
+    return x
 
 
 # Unit registry
@@ -99,35 +110,38 @@ class Quantity(pint.Quantity[float]):
         if unit is not None:
             return Quantity(super().to_compact(unit))
 
-        if self.units == dimensionless:
-            # Make copy
-            return typing.cast(Quantity, self.to(dimensionless))
+        if self._units == dimensionless._units:
+            # Make copy, already in target units so no conversion required
+            return Quantity(self._magnitude, self._units)
 
-        if self.is_compatible_with(registry.meter) and self.m_as(registry.kilometer) >= self._DISTANCE_MAX:
+        if self.is_compatible_with(_UNIT_METER) and self.m_as(_UNIT_KILOMETER) >= self._DISTANCE_MAX:
             # Clamp distances to kilometers
-            return self.to(registry.kilometer)
+            return self.to(_UNIT_KILOMETER)
+
+        compact = _COMPACT_DIMENSIONLESS.get(self._units)
 
-        to_mag = self.magnitude
-        to_unit = self.units
+        if compact is not None:
+            # Scale only within "dimensionless" type units, don't append SI prefix
+            to_mag = self.magnitude
 
-        # Scale only within "dimensionless" type units, don't append SI prefix
-        if to_unit == registry.percent and to_mag < 0.1:
-            to_mag *= 10000.0
-            to_unit = registry.ppm
+            if not isinstance(to_mag, (int, float)) or not math.isfinite(to_mag):
+                # Arrays cannot share a single unit scale and non-finite values can't be scaled, keep as-is
+                return Quantity(self._magnitude, self._units)
 
-        if to_unit == registry.ppm and to_mag < 1.0:
-            to_mag *= 1000.0
-            to_unit = registry.ppb
+            exponent, percent_min, ppm_min = compact
 
-        if to_unit == registry.ppb and to_mag >= 1000.0:
-            to_mag /= 1000.0
-            to_unit = registry.ppm
+            if to_mag >= percent_min:
+                to_exponent, to_unit = _COMPACT_PERCENT
+            elif to_mag >= ppm_min:
+                to_exponent, to_unit = _COMPACT_PPM
+            else:
+                to_exponent, to_unit = _COMPACT_PPB
 
-        if to_unit == registry.ppm and to_mag >= 1000.0:
-            to_mag /= 10000.0
-            to_unit = registry.percent
+            if to_exponent < exponent:
+                to_mag *= 10.0 ** (exponent - to_exponent)
+            elif to_exponent > exponent:
+                to_mag /= 10.0 ** (to_exponent - exponent)
 
-        if to_unit in [registry.percent, registry.ppm, registry.ppb]:
             return Quantity(to_mag, to_unit)
 
         return super().to_compact(unit)
@@ -137,16 +151,22 @@ class Quantity(pint.Quantity[float]):
         if spec == '':
             spec = self.default_format
 
-        formatted: str = super().__format__(spec)
+        if spec == _DEFAULT_FORMAT and isinstance(self._magnitude, (int, float)) and \
+                self._REGISTRY.fmt_locale is None:
+            # Fast path for default format of scalars, avoids repeated format specification parsing
+            obj = self.to_compact()
+            mstr = format(obj.magnitude, _DEFAULT_FORMAT_MSPEC)
+
+            if obj._units == _UNIT_PERCENT._units:
+                return mstr + '%'
 
-        if ' ' not in formatted:
-            return formatted
+            return f"{mstr} {_format_units_default(obj._units)}".strip()
 
-        formatted_num, formatted_unit = formatted.split(' ', 1)
+        formatted: str = super().__format__(spec)
 
-        if formatted_unit.strip() == '%':
+        if formatted.endswith(' %') and formatted.find(' ') == len(formatted) - 2:
             # Remove space from percentages
-            return formatted_num + '%'
+            return formatted[:-2] + '%'
 
         return formatted
 
@@ -155,7 +175,7 @@ class Unit(pint.Unit):
     _REGISTRY = registry
 
     def __format__(self, spec: str) -> str:
-        if self == registry.percent:
+        if self._units == _UNIT_PERCENT._units:
             return '%'
 
         return super().__format__(spec)
@@ -183,15 +203,13 @@ class Measurement(pint.Measurement):
             obj = self
 
         if mspec == 'g':
-            mstr = format(obj.magnitude, '.6g').replace('+/-', '±')
+            mstr = format(obj.magnitude, '.6g')
 
-            if '±' in mstr:
-                mag, sep, error = mstr.partition('±')
+            if '+/-' in mstr:
+                mag, _, error = mstr.partition('+/-')
+                mstr = mag.rstrip('0').rstrip('.') + '±' + error.rstrip('0').rstrip('.')
             else:
-                mag = mstr
-                sep = error = ''
-
-            mstr = mag.rstrip('0').rstrip('.') + sep + error.rstrip('0').rstrip('.')
+                mstr = mstr.rstrip('0').rstrip('.')
         else:
             mstr = format(obj.magnitude, mspec).replace('+/-', '±')
 
@@ -211,26 +229,77 @@ registry.Measurement = Measurement
 # Shortcuts for dimensionless quantities (must occur after subclassing of Unit)
 dimensionless = registry.dimensionless
 
+# Frequently used units resolved once, registry attribute access parses the unit name on every call
+_UNIT_METER = registry.meter
+_UNIT_KILOMETER = registry.kilometer
+_UNIT_PERCENT = registry.percent
+_UNIT_SECOND = registry.sec
+
+# Parts-per-one exponent and units used by Quantity.to_compact for dimensionless scaling
+_COMPACT_PERCENT = (-2, _UNIT_PERCENT)
+_COMPACT_PPM = (-6, registry.ppm)
+_COMPACT_PPB = (-9, registry.ppb)
+
+# Lookup by units of exponent along with minimum magnitudes (in the same units) for percent and ppm
+_COMPACT_DIMENSIONLESS = {
+    compact_unit._units: (exponent, 10.0 ** (-3 - exponent), 10.0 ** (-6 - exponent))
+    for exponent, compact_unit in (_COMPACT_PERCENT, _COMPACT_PPM, _COMPACT_PPB)
+}
+
 
 # Change default printing format
 # noinspection PyShadowingNames,PyUnusedLocal
 @pint.register_unit_format('gasify')
 def format_custom(unit, registry: pint.registry.BaseRegistry, **options: typing.Any) -> str:
+    if len(unit) == 1 and not options:
+        # Single unit with unity exponent needs no ratio or power formatting
+        (unit_name, unit_exponent), = unit.items()
+
+        if unit_exponent == 1:
+            return unit_name
+
+    try:
+        return _format_custom_items(tuple(unit.items()), tuple(sorted(options.items())))
+    except TypeError:
+        # Unhashable options, format without caching
+        return _format_custom_items.__wrapped__(tuple(unit.items()), tuple(options.items()))
+
+
+@functools.lru_cache(maxsize=256)
+def _format_custom_items(unit_items: typing.Tuple[typing.Tuple[str, typing.Any], ...],
+                         options: typing.Tuple[typing.Tuple[str, typing.Any], ...]) -> str:
+    # Formatted string depends only on unit terms and options so can be cached
     unit_str = pint.formatter(
-        unit.items(),
+        unit_items,
         as_ratio=True,
         single_denominator=False,
         product_fmt=" ",
         division_fmt="/",
         power_fmt="{}^{}",
         parentheses_fmt=r"({})",
-        **options,
+        **dict(options),
     )
 
     return unit_str
 
 
-registry.default_format = 'g~#gasify'
+_DEFAULT_FORMAT = 'g~#gasify'
+_DEFAULT_FORMAT_MSPEC = 'g'
+_DEFAULT_FORMAT_USPEC = '~gasify'
+
+registry.default_format = _DEFAULT_FORMAT
+
+
+@functools.lru_cache(maxsize=None)
+def _format_units_default(units: pint.util.UnitsContainer) -> str:
+    # Unit strings depend only on units for the default format, magnitude is formatted separately
+    unit_str = format(Unit(units), _DEFAULT_FORMAT_USPEC)
+
+    if unit_str.startswith('1 /'):
+        # Write e.g. "3 / s" instead of "3 1 / s"
+        return unit_str[2:]
+
+    return unit_str
 
 
 # Handle pickle/unpickling by overwriting the built-in unit registry
@@ -254,12 +323,45 @@ def parse_unit(x: TParseUnit) -> Unit:
     if not isinstance(x, str):
         raise ParseError(f"Unsupported input type \"{type(x)}\"")
 
+    return _parse_unit_str(x)
+
+
+@functools.lru_cache(maxsize=None)
+def _parse_unit_str(x: str) -> Unit:
+    # Registry is not modified after import so lookups by name can be cached
     if hasattr(registry, x):
         return getattr(registry, x)
 
     raise UnknownUnit(f"Unknown unit \"{x}\"")
 
 
+@functools.lru_cache(maxsize=1024)
+def _parse_quantity_str(x: str) -> typing.Tuple[typing.Any, pint.util.UnitsContainer]:
+    # Cache magnitude and units rather than the Quantity itself as Quantity objects can be modified in-place
+    x_qty = Quantity(x)
+
+    return x_qty.magnitude, x_qty._units
+
+
+def _convert(x: Quantity, to_unit: Unit) -> Quantity:
+    if not x.unitless:
+        try:
+            # Don't use in-place change, can mess up values passed to some methods
+            return x.to(to_unit)
+        except pint.errors.DimensionalityError as ex:
+            raise IncompatibleUnits(f"Unable to convert parsed quantity {x!s} to units {to_unit!s}") from ex
+    else:
+        return Quantity(x.m_as(dimensionless), to_unit)
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_quantity_str_to(x: str, to_unit: Unit) -> typing.Tuple[typing.Any, pint.util.UnitsContainer]:
+    # Cache converted string results by target unit, strings are often parsed repeatedly to the same unit
+    x_qty = _convert(Quantity(*_parse_quantity_str(x)), to_unit)
+
+    return x_qty.magnitude, x_qty._units
+
+
 def parse(x: TParseQuantity, to_unit: typing.Optional[TParseUnit] = None,
           mag_round: typing.Optional[int] = None) -> Quantity:
     """ Parse arbitrary input to a Quantity of specified unit.
@@ -276,27 +378,38 @@ def parse(x: TParseQuantity, to_unit: typing.Optional[TParseUnit] = None,
     if to_unit is not None:
         to_unit = parse_unit(to_unit)
 
+    if isinstance(x, Quantity) and to_unit is not None and x._units == to_unit._units:
+        # Already in target units, skip conversion but return a copy as callers may modify the result in-place
+        if mag_round is None:
+            return Quantity(x._magnitude, x._units)
+
+        return typing.cast(Quantity, round(x, mag_round))
+
     if not isinstance(x, Quantity):
-        # Convert int to float
-        if isinstance(x, int):
+        # Convert floats (and ints) to Quantity, attempt to directly parse strings
+        if isinstance(x, (int, float)):
             x = float(x)
 
-        # Convert floats (and ints) to Quantity, attempt to directly parse strings
-        if isinstance(x, float) or isinstance(x, str):
+            if to_unit is not None:
+                # Numbers are taken as already being in the target unit, no conversion required
+                x = Quantity(x, to_unit)
+
+                return x if mag_round is None else typing.cast(Quantity, round(x, mag_round))
+
             x = Quantity(x)
+        elif isinstance(x, str):
+            if to_unit is not None:
+                x = Quantity(*_parse_quantity_str_to(x, to_unit))
+
+                return x if mag_round is None else typing.cast(Quantity, round(x, mag_round))
+
+            x = Quantity(*_parse_quantity_str(x))
         else:
             raise ParseError(f"Unsupported input type \"{type(x)}\"")
 
     # Attempt conversion
     if to_unit is not None:
-        if not x.unitless:
-            try:
-                # Don't use in-place change, can mess up values passed to some methods
-                x = x.to(to_unit)
-            except pint.errors.DimensionalityError as ex:
-                raise IncompatibleUnits(f"Unable to convert parsed quantity {x!s} to units {to_unit!s}") from ex
-        else:
-            x = Quantity(x.m_as(dimensionless), to_unit)
+        x = _convert(x, to_unit)
 
     # x = typing.cast(Quantity, x)
 
@@ -322,8 +435,19 @@ def parse_magnitude(x: TParseQuantity, magnitude_unit: TParseUnit = None,
     if input_unit is None:
         # Assume default parsing unit is same as casting unit
         input_unit = magnitude_unit
+    else:
+        input_unit = parse_unit(input_unit)
 
     if magnitude_unit is not None:
+        if isinstance(x, Quantity) and input_unit._units == magnitude_unit._units and \
+                x._units == magnitude_unit._units and isinstance(x._magnitude, (int, float)):
+            # Already in input and target units, skip conversion
+            return float(x._magnitude)
+
+        if isinstance(x, (int, float)) and input_unit is magnitude_unit:
+            # Plain numbers are assumed to already be in target units
+            return float(x)
+
         return parse(x, input_unit).m_as(magnitude_unit)
     else:
         return parse(x, input_unit).magnitude
@@ -338,7 +462,7 @@ def parse_timedelta(x: TParseTimeDelta) -> timedelta:
     if isinstance(x, timedelta):
         # Already a timedelta
         return x
-    elif isinstance(x, float) or isinstance(x, int):
+    elif isinstance(x, (int, float)):
         # Count as seconds
         return timedelta(seconds=x)
 
@@ -346,7 +470,7 @@ def parse_timedelta(x: TParseTimeDelta) -> timedelta:
 
     if x_unit.dimensionless:
         # Assume seconds by default
-        x_unit = Quantity(x_unit.m_as(dimensionless), registry.sec)
+        x_unit = Quantity(x_unit.m_as(dimensionless), _UNIT_SECOND)
 
     return x_unit.to_timedelta()
 
@@ -359,7 +483,7 @@ def converter(to_unit: typing.Optional[TParseUnit] = None,
     :param optional: if False
     :return:
     """
-    to_unit = to_unit or dimensionless
+    to_unit = parse_unit(to_unit or dimensionless)
 
     def f(x: typing.Optional[TParseQuantity]) -> typing.Optional[Quantity]:
         if x is None:
@@ -368,6 +492,14 @@ def converter(to_unit: typing.Optional[TParseUnit] = None,
 
             return None
 
+        if isinstance(x, (int, float)):
+            # Numbers are taken as already being in the target unit
+            return Quantity(float(x), to_unit)
+
+        if isinstance(x, Quantity) and x._units == to_unit._units:
+            # Copy so stored values don't share identity with the caller's Quantity
+            return Quantity(x._magnitude, x._units)
+
         return parse(x, to_unit)
 
     return f
@@ -395,7 +527,7 @@ def return_converter(to_unit: TParseUnit, allow_none: bool = False):
 
             if not isinstance(result, Quantity):
                 result = parse(result, to_unit)
-            else:
+            elif result._units != to_unit._units:
                 result.ito(to_unit)
 
             return result
@@ -1,5 +1,9 @@
 import typing
 import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+import numpy as np
 
 from gasify import gas, unit
 
@@ -49,6 +53,27 @@ class CompoundTestCase(unittest.TestCase):
     #         with self.subTest(gas_name):
     #             self.assertAlmostEqual(gas.registry[gas_name].gcf, gcf, 2)
 
+    def test_gcf_cached(self):
+        self.assertAlmostEqual(gas.registry.nitrogen.gcf, 1, 2)
+        self.assertIsNone(gas.registry.nitric_oxides.gcf)
+
+        # Computed once on construction, access must not parse the gas properties again
+        compound = gas.Compound(
+            'Test',
+            molecular_structure=gas.DIATOMIC,
+            specific_heat='0.25 cal/g',
+            density='1.25 g/L'
+        )
+
+        with mock.patch.object(gas, 'parse_magnitude') as parse_magnitude:
+            self.assertAlmostEqual(compound.gcf, 0.3106 / (0.25 * 1.25), 9)
+            parse_magnitude.assert_not_called()
+
+    def test_gcf_numeric(self):
+        a = gas.Compound('Test', molecular_structure=gas.DIATOMIC, specific_heat=0.2485, density=1.25)
+
+        self.assertAlmostEqual(gas.registry.nitrogen.gcf, a.gcf, 9)
+
     def test_sort(self):
         self.assertListEqual(
             sorted([
@@ -100,6 +125,18 @@ class CompoundConcentrationTestCase(unittest.TestCase):
         with self.assertRaises(TypeError):
             _ = gas.CompoundConcentration(0.1, gas.registry.oxygen) * object()
 
+        with self.assertRaises(ValueError):
+            _ = gas.CompoundConcentration('1 V', gas.registry.oxygen)
+
+        with self.assertRaises(ValueError):
+            _ = gas.CompoundConcentration('-1 %', gas.registry.oxygen)
+
+        with self.assertRaises(ValueError):
+            _ = gas.CompoundConcentration._from_float(-0.1, gas.registry.oxygen)
+
+        with self.assertRaises(ValueError):
+            _ = gas.CompoundConcentration._from_float(float('nan'), gas.registry.oxygen)
+
     def test_equal(self):
         a = 1.0 * gas.registry.oxygen
         b = 1.0 * gas.registry.oxygen
@@ -208,6 +245,25 @@ class MixtureTestCase(unittest.TestCase):
         with self.assertRaises(ValueError):
             _ = a.gcf
 
+    def test_gcf_batch(self):
+        compounds = (gas.registry.oxygen, gas.registry.hydrogen, gas.registry.nitrogen)
+        concentration = np.array([
+            [0.21, 0.0, 0.79],
+            [0.1, 0.2, 0.7],
+            [0.0, 0.0, 1.0]
+        ])
+
+        gcf = gas.batch_gcf(concentration, compounds)
+
+        for row, expected in zip(concentration, gcf):
+            self.assertAlmostEqual(gas.Mixture(*(c * x for c, x in zip(row, compounds) if c > 0)).gcf, expected, 9)
+
+        with self.assertRaises(ValueError):
+            gas.batch_gcf(concentration, compounds[:2])
+
+        with self.assertRaises(ValueError):
+            gas.batch_gcf(concentration, (gas.registry.nitric_oxides, ) + compounds[1:])
+
     def test_contains(self):
         a = gas.Mixture(0.1 * gas.registry.oxygen, 0.2 * gas.registry.hydrogen)
 
@@ -261,6 +317,10 @@ class MixtureTestCase(unittest.TestCase):
             True
         )
 
+        with self.assertRaises(ValueError):
+            gas.Mixture.auto_balance(0.6 * gas.registry.oxygen, 0.5 * gas.registry.hydrogen,
+                                     balance=gas.registry.nitrogen)
+
     def test_mix_add(self):
         a = gas.Mixture(0.1 * gas.registry.oxygen, 0.2 * gas.registry.hydrogen)
         b = 0.3 * gas.registry.nitrogen
@@ -367,6 +427,16 @@ class MixtureTestCase(unittest.TestCase):
             True
         )
 
+    def test_total(self):
+        a = gas.Mixture(0.1 * gas.registry.oxygen, 0.1 * gas.registry.hydrogen)
+        total = a.total
+
+        total.ito(unit.registry.ppm)
+
+        # Modifying the returned Quantity must not change the mixture
+        self.assertEqual(a.total.units, unit.dimensionless)
+        self.assertAlmostEqual(a.total.magnitude, 0.2, 9)
+
     def test_norm(self):
         a = gas.Mixture(0.1 * gas.registry.oxygen, 0.1 * gas.registry.hydrogen)
 
@@ -406,5 +476,28 @@ class MixtureTestCase(unittest.TestCase):
         )
 
 
+class RegistryTestCase(unittest.TestCase):
+    def test_export(self):
+        self.assertIn('registry', dir(gas))
+
+        namespace: typing.Dict[str, typing.Any] = {}
+        exec('from gasify.gas import *', namespace)
+
+        self.assertIs(namespace['registry'], gas.registry)
+
+    def test_build_once(self):
+        original = gas.registry
+        del gas.__dict__['registry']
+
+        try:
+            with ThreadPoolExecutor(8) as executor:
+                results = list(executor.map(lambda _: gas.registry, range(8)))
+
+            for result in results:
+                self.assertIs(result, gas.registry)
+        finally:
+            gas.__dict__['registry'] = original
+
+
 if __name__ == '__main__':
     unittest.main()
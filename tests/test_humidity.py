@@ -1,155 +1,190 @@
 import unittest
+import warnings
+
+import numpy as np
 
 from gasify import humidity, unit
 
 from tests.util import QuantityTestCase
 
+_degC = unit.registry.degC
+_Pa = unit.registry.Pa
+_kPa = unit.registry.kPa
+_MPa = unit.registry.MPa
+
+_FREEZE = humidity.WATER_TEMPERATURE_FREEZE.m_as(_degC)
+
 
 class WaterVaporPressureTestCase(QuantityTestCase):
     _REFERENCE_VALUES = [
         # Reference values from doi: 10.6028/jres.073A.039
-        (unit.Quantity(25, unit.registry.degC), unit.Quantity(3168.6, unit.registry.Pa)),
-        (unit.Quantity(40, unit.registry.degC), unit.Quantity(7381.3, unit.registry.Pa)),
-        (unit.Quantity(50, unit.registry.degC), unit.Quantity(12344.6, unit.registry.Pa)),
-        (unit.Quantity(60, unit.registry.degC), unit.Quantity(19344.6, unit.registry.Pa)),
-        (unit.Quantity(70, unit.registry.degC), unit.Quantity(31177.0, unit.registry.Pa)),
-        (unit.Quantity(80, unit.registry.degC), unit.Quantity(47375.2, unit.registry.Pa)),
-        (unit.Quantity(100, unit.registry.degC), unit.Quantity(101325.0, unit.registry.Pa)),
+        (25, unit.Quantity(3168.6, _Pa)),
+        (40, unit.Quantity(7381.3, _Pa)),
+        (50, unit.Quantity(12344.6, _Pa)),
+        (60, unit.Quantity(19344.6, _Pa)),
+        (70, unit.Quantity(31177.0, _Pa)),
+        (80, unit.Quantity(47375.2, _Pa)),
+        (100, unit.Quantity(101325.0, _Pa)),
     ]
 
+    def assertVaporPressure(self, method, test_values):
+        # Temperatures are plain degrees Celsius or a Quantity, evaluate all of them in a single array call
+        result = method(unit.Quantity(np.array([
+            temperature.m_as(_degC) if isinstance(temperature, unit.Quantity) else float(temperature)
+            for temperature, _, _ in test_values
+        ]), _degC))
+
+        for n, (temperature, expected, places) in enumerate(test_values):
+            if not isinstance(temperature, unit.Quantity):
+                temperature = unit.Quantity(temperature, _degC)
+
+            with self.subTest(f"p({temperature}) = {expected}"):
+                self.assertQuantity(result[n], expected, places, _MPa)
+
+                # Scalar Quantity input
+                self.assertQuantity(method(temperature), expected, places, _MPa)
+
     def test_wagner_pruss(self):
         test_values = [
-            (unit.Quantity(-100, unit.registry.degC), unit.Quantity(0.003683, unit.registry.Pa), 6),
-            (unit.Quantity(-75, unit.registry.degC), unit.Quantity(0.25484, unit.registry.Pa), 6),
-            (unit.Quantity(-50, unit.registry.degC), unit.Quantity(6.447, unit.registry.Pa), 6),
-            (unit.Quantity(-25, unit.registry.degC), unit.Quantity(80.88, unit.registry.Pa), 6),
-            (humidity.WATER_TEMPERATURE_FREEZE, unit.Quantity(611.2, unit.registry.Pa), 6),
-            (unit.Quantity(25, unit.registry.degC), unit.Quantity(3170, unit.registry.Pa), 6),
-            (unit.Quantity(50, unit.registry.degC), unit.Quantity(12352, unit.registry.Pa), 5),
-            (unit.Quantity(75, unit.registry.degC), unit.Quantity(38597, unit.registry.Pa), 5),
-            (unit.Quantity(100, unit.registry.degC), unit.Quantity(101418, unit.registry.Pa), 5),
-            (unit.Quantity(150, unit.registry.degC), unit.Quantity(476159, unit.registry.Pa), 5),
-            (unit.Quantity(200, unit.registry.degC), unit.Quantity(1554939, unit.registry.Pa), 4),
-            (unit.Quantity(300, unit.registry.degC), unit.Quantity(8587867, unit.registry.Pa), 5),
-            (humidity.WATER_TEMPERATURE_CRITICAL, unit.Quantity(21813821, unit.registry.Pa), 0),
+            (-100, unit.Quantity(0.003683, _Pa), 6),
+            (-75, unit.Quantity(0.25484, _Pa), 6),
+            (-50, unit.Quantity(6.447, _Pa), 6),
+            (-25, unit.Quantity(80.88, _Pa), 6),
+            (_FREEZE, unit.Quantity(611.2, _Pa), 6),
+            (25, unit.Quantity(3170, _Pa), 6),
+            (50, unit.Quantity(12352, _Pa), 5),
+            (75, unit.Quantity(38597, _Pa), 5),
+            (100, unit.Quantity(101418, _Pa), 5),
+            (150, unit.Quantity(476159, _Pa), 5),
+            (200, unit.Quantity(1554939, _Pa), 4),
+            (300, unit.Quantity(8587867, _Pa), 5),
+            (humidity.WATER_TEMPERATURE_CRITICAL, unit.Quantity(21813821, _Pa), 0),
         ]
 
-        for temperature, expected, places in test_values:
-            with self.subTest(f"p({temperature}) = {expected}"):
-                self.assertQuantity(
-                    humidity.water_vp_sat_wagner_pruss(temperature),
-                    expected,
-                    places,
-                    unit.registry.MPa
-                )
+        self.assertVaporPressure(humidity.water_vp_sat_wagner_pruss, test_values)
 
     def test_antoine(self):
         test_values = [
-            (humidity.WATER_TEMPERATURE_FREEZE, unit.Quantity(0.0006056, unit.registry.MPa), 6),
-            (unit.Quantity(25, unit.registry.degC), unit.Quantity(0.003158, unit.registry.MPa), 5),
-            (unit.Quantity(50, unit.registry.degC), unit.Quantity(0.012306, unit.registry.MPa), 5),
-            (unit.Quantity(75, unit.registry.degC), unit.Quantity(0.03846, unit.registry.MPa), 4),
-            (unit.Quantity(100, unit.registry.degC), unit.Quantity(0.10134, unit.registry.MPa), 4),
-            (unit.Quantity(150, unit.registry.degC), unit.Quantity(0.47255, unit.registry.MPa), 4),
-            (unit.Quantity(200, unit.registry.degC), unit.Quantity(1.552, unit.registry.MPa), 3),
-            (unit.Quantity(300, unit.registry.degC), unit.Quantity(8.692, unit.registry.MPa), 3),
-            (humidity.WATER_TEMPERATURE_CRITICAL, unit.Quantity(21.73, unit.registry.MPa), 1),
+            (_FREEZE, unit.Quantity(0.0006056, _MPa), 6),
+            (25, unit.Quantity(0.003158, _MPa), 5),
+            (50, unit.Quantity(0.012306, _MPa), 5),
+            (75, unit.Quantity(0.03846, _MPa), 4),
+            (100, unit.Quantity(0.10134, _MPa), 4),
+            (150, unit.Quantity(0.47255, _MPa), 4),
+            (200, unit.Quantity(1.552, _MPa), 3),
+            (300, unit.Quantity(8.692, _MPa), 3),
+            (humidity.WATER_TEMPERATURE_CRITICAL, unit.Quantity(21.73, _MPa), 1),
         ]
 
-        for temperature, expected, places in test_values:
-            with self.subTest(f"p({temperature}) = {expected}"):
-                self.assertQuantity(
-                    humidity.water_vp_sat_antoine(temperature),
-                    expected,
-                    places,
-                    unit.registry.MPa
-                )
+        self.assertVaporPressure(humidity.water_vp_sat_antoine, test_values)
 
     def test_antoine_warning(self):
         with self.assertWarns(UserWarning):
             humidity.water_vp_sat_antoine(-1)
 
+    def test_disable_warning(self):
+        humidity.set_range_warnings(False)
+
+        try:
+            with warnings.catch_warnings():
+                warnings.simplefilter('error', humidity.TemperatureRangeWarning)
+                humidity.water_vp_sat_antoine(-1)
+        finally:
+            humidity.set_range_warnings(True)
+
     def test_simple(self):
         test_values = [
-            (humidity.WATER_TEMPERATURE_FREEZE, unit.Quantity(0.0006521, unit.registry.MPa), 4),
-            (unit.Quantity(25, unit.registry.degC), unit.Quantity(0.003157, unit.registry.MPa), 4),
-            (unit.Quantity(50, unit.registry.degC), unit.Quantity(0.01197, unit.registry.MPa), 3),
-            (unit.Quantity(75, unit.registry.degC), unit.Quantity(0.03748, unit.registry.MPa), 3),
-            (unit.Quantity(100, unit.registry.degC), unit.Quantity(0.10072, unit.registry.MPa), 2),
-            (unit.Quantity(150, unit.registry.degC), unit.Quantity(0.47255, unit.registry.MPa), 1)
+            (_FREEZE, unit.Quantity(0.0006521, _MPa), 4),
+            (25, unit.Quantity(0.003157, _MPa), 4),
+            (50, unit.Quantity(0.01197, _MPa), 3),
+            (75, unit.Quantity(0.03748, _MPa), 3),
+            (100, unit.Quantity(0.10072, _MPa), 2),
+            (150, unit.Quantity(0.47255, _MPa), 1)
         ]
 
-        for temperature, expected, places in test_values:
-            with self.subTest(f"p({temperature}) = {expected}"):
-                self.assertQuantity(
-                    humidity.water_vp_sat_simple(temperature),
-                    expected,
-                    places,
-                    unit.registry.MPa
-                )
+        self.assertVaporPressure(humidity.water_vp_sat_simple, test_values)
 
     def test_magnus(self):
         test_values = [
-            (humidity.WATER_TEMPERATURE_FREEZE, unit.Quantity(0.000611, unit.registry.MPa), 4),
-            (unit.Quantity(25, unit.registry.degC), unit.Quantity(0.003162, unit.registry.MPa), 5),
-            (unit.Quantity(50, unit.registry.degC), unit.Quantity(0.01236, unit.registry.MPa), 3),
-            (unit.Quantity(75, unit.registry.degC), unit.Quantity(0.039, unit.registry.MPa), 2),
-            (unit.Quantity(100, unit.registry.degC), unit.Quantity(0.10408, unit.registry.MPa), 2),
-            (unit.Quantity(150, unit.registry.degC), unit.Quantity(0.5096, unit.registry.MPa), 4),
-            (unit.Quantity(200, unit.registry.degC), unit.Quantity(1.7435, unit.registry.MPa), 3),
-            (unit.Quantity(300, unit.registry.degC), unit.Quantity(10.343, unit.registry.MPa), 3)
+            (_FREEZE, unit.Quantity(0.000611, _MPa), 4),
+            (25, unit.Quantity(0.003162, _MPa), 5),
+            (50, unit.Quantity(0.01236, _MPa), 3),
+            (75, unit.Quantity(0.039, _MPa), 2),
+            (100, unit.Quantity(0.10408, _MPa), 2),
+            (150, unit.Quantity(0.5096, _MPa), 4),
+            (200, unit.Quantity(1.7435, _MPa), 3),
+            (300, unit.Quantity(10.343, _MPa), 3)
         ]
 
-        for temperature, expected, places in test_values:
-            with self.subTest(f"p({temperature}) = {expected}"):
-                self.assertQuantity(
-                    humidity.water_vp_sat_magnus(temperature).to(unit.registry.kPa),
-                    expected,
-                    places,
-                    unit.registry.MPa
-                )
+        self.assertVaporPressure(humidity.water_vp_sat_magnus, test_values)
 
     def test_tetens(self):
         test_values = [
-            (humidity.WATER_TEMPERATURE_FREEZE, unit.Quantity(0.0006108, unit.registry.MPa), 4),
-            (unit.Quantity(25, unit.registry.degC), unit.Quantity(0.0031677, unit.registry.MPa), 5),
-            (unit.Quantity(50, unit.registry.degC), unit.Quantity(0.012336, unit.registry.MPa), 3),
-            (unit.Quantity(75, unit.registry.degC), unit.Quantity(0.038646, unit.registry.MPa), 2),
-            (unit.Quantity(100, unit.registry.degC), unit.Quantity(0.10221, unit.registry.MPa), 2),
-            (unit.Quantity(150, unit.registry.degC), unit.Quantity(0.4906, unit.registry.MPa), 4),
-            (unit.Quantity(200, unit.registry.degC), unit.Quantity(1.645, unit.registry.MPa), 3),
-            (unit.Quantity(300, unit.registry.degC), unit.Quantity(9.411, unit.registry.MPa), 3)
+            (_FREEZE, unit.Quantity(0.0006108, _MPa), 4),
+            (25, unit.Quantity(0.0031677, _MPa), 5),
+            (50, unit.Quantity(0.012336, _MPa), 3),
+            (75, unit.Quantity(0.038646, _MPa), 2),
+            (100, unit.Quantity(0.10221, _MPa), 2),
+            (150, unit.Quantity(0.4906, _MPa), 4),
+            (200, unit.Quantity(1.645, _MPa), 3),
+            (300, unit.Quantity(9.411, _MPa), 3)
         ]
 
-        for temperature, expected, places in test_values:
-            with self.subTest(f"p({temperature}) = {expected}"):
-                self.assertQuantity(
-                    humidity.water_vp_sat_tetens(temperature).to(unit.registry.kPa),
-                    expected,
-                    places,
-                    unit.registry.MPa
-                )
+        self.assertVaporPressure(humidity.water_vp_sat_tetens, test_values)
 
     def test_buck(self):
         test_values = [
-            (humidity.WATER_TEMPERATURE_FREEZE, unit.Quantity(0.0006112, unit.registry.MPa), 4),
-            (unit.Quantity(25, unit.registry.degC), unit.Quantity(0.0031685, unit.registry.MPa), 5),
-            (unit.Quantity(50, unit.registry.degC), unit.Quantity(0.01235, unit.registry.MPa), 3),
-            (unit.Quantity(75, unit.registry.degC), unit.Quantity(0.038595, unit.registry.MPa), 2),
-            (unit.Quantity(100, unit.registry.degC), unit.Quantity(0.1013, unit.registry.MPa), 2),
-            (unit.Quantity(150, unit.registry.degC), unit.Quantity(0.4703, unit.registry.MPa), 4),
-            (unit.Quantity(200, unit.registry.degC), unit.Quantity(1.4895, unit.registry.MPa), 3),
-            (unit.Quantity(300, unit.registry.degC), unit.Quantity(7.16, unit.registry.MPa), 3)
+            (_FREEZE, unit.Quantity(0.0006112, _MPa), 4),
+            (25, unit.Quantity(0.0031685, _MPa), 5),
+            (50, unit.Quantity(0.01235, _MPa), 3),
+            (75, unit.Quantity(0.038595, _MPa), 2),
+            (100, unit.Quantity(0.1013, _MPa), 2),
+            (150, unit.Quantity(0.4703, _MPa), 4),
+            (200, unit.Quantity(1.4895, _MPa), 3),
+            (300, unit.Quantity(7.16, _MPa), 3)
         ]
 
-        for temperature, expected, places in test_values:
-            with self.subTest(f"p({temperature}) = {expected}"):
-                self.assertQuantity(
-                    humidity.water_vp_sat_buck(temperature).to(unit.registry.kPa),
-                    expected,
-                    places,
-                    unit.registry.MPa
-                )
+        self.assertVaporPressure(humidity.water_vp_sat_buck, test_values)
+
+    def test_two_pole(self):
+        test_values = [
+            (-25, unit.Quantity(0.00008088, _MPa), 6),
+            (_FREEZE, unit.Quantity(0.0006112, _MPa), 7),
+            (25, unit.Quantity(0.00317, _MPa), 6),
+            (50, unit.Quantity(0.012352, _MPa), 6),
+            (75, unit.Quantity(0.038597, _MPa), 5),
+            (100, unit.Quantity(0.101418, _MPa), 4)
+        ]
+
+        self.assertVaporPressure(humidity.water_vp_sat_two_pole, test_values)
+
+        # Documented accuracy relative to Wagner-Pruss
+        for temperature_min, temperature_max, tolerance in [(-40, 0, 0.004), (0, 100, 0.0005)]:
+            with self.subTest(f"{temperature_min} to {temperature_max} °C within {tolerance:.2%}"):
+                temperature = unit.Quantity(np.linspace(temperature_min, temperature_max, 41), _degC)
+                expected = humidity.water_vp_sat_wagner_pruss(temperature).m_as(_Pa)
+                error = humidity.water_vp_sat_two_pole(temperature).m_as(_Pa) / expected - 1
+
+                self.assertLessEqual(np.max(np.abs(error)), tolerance)
+
+    def test_array(self):
+        temperature = np.array([0.0, 25.0, 50.0, 75.0])
+
+        for method in [humidity.water_vp_sat_wagner_pruss, humidity.water_vp_sat_simple,
+                       humidity.water_vp_sat_antoine, humidity.water_vp_sat_magnus, humidity.water_vp_sat_tetens,
+                       humidity.water_vp_sat_buck, humidity.water_vp_sat_two_pole]:
+            with self.subTest(method.__name__):
+                result = method(unit.Quantity(temperature, _degC))
+
+                self.assertIsInstance(result, unit.Quantity)
+                self.assertEqual(result.magnitude.shape, temperature.shape)
+
+                for n, temperature_m in enumerate(temperature):
+                    self.assertAlmostEqual(
+                        result[n].m_as(_Pa),
+                        method(unit.Quantity(temperature_m, _degC)).m_as(_Pa),
+                        6
+                    )
 
 
 class TestDataHumidity(QuantityTestCase):
@@ -176,6 +211,16 @@ class TestDataHumidity(QuantityTestCase):
                 humidity.unit_absolute
             )
 
+        with self.subTest('custom method'):
+            calc_abs_humid = humidity.relative_to_absolute(1.0, 30.0, lambda t: humidity.water_vp_sat_wagner_pruss(t))
+
+            self.assertQuantity(
+                abs_humid,
+                calc_abs_humid,
+                2,
+                humidity.unit_absolute
+            )
+
     def test_abs_to_rel(self):
         rel_humid = unit.parse('100%')
 
@@ -199,6 +244,45 @@ class TestDataHumidity(QuantityTestCase):
                 unit.dimensionless
             )
 
+        with self.subTest('custom method'):
+            calc_rel_humid = humidity.absolute_to_relative(
+                30.359,
+                30,
+                lambda t: humidity.water_vp_sat_wagner_pruss(t).to(_kPa)
+            )
+
+            self.assertQuantity(
+                rel_humid,
+                calc_rel_humid,
+                2,
+                unit.dimensionless
+            )
+
+    def test_array(self):
+        temperature = np.array([10.0, 20.0, 30.0])
+        relative_humid = np.array([0.25, 0.5, 1.0])
+
+        with self.subTest('array temperature'):
+            calc_abs_humid = humidity.relative_to_absolute(1.0, unit.Quantity(temperature, _degC))
+
+            self.assertEqual(calc_abs_humid.magnitude.shape, temperature.shape)
+            self.assertAlmostEqual(calc_abs_humid[2].m_as(humidity.unit_absolute), 30.359, 2)
+
+        with self.subTest('broadcast'):
+            calc_abs_humid = humidity.relative_to_absolute(relative_humid[:, np.newaxis], temperature)
+            calc_rel_humid = humidity.absolute_to_relative(calc_abs_humid, temperature)
+
+            self.assertEqual(calc_abs_humid.magnitude.shape, (3, 3))
+
+            for n, expected in enumerate(relative_humid):
+                for m in range(len(temperature)):
+                    self.assertAlmostEqual(calc_rel_humid[n, m].m_as(unit.dimensionless), expected, 6)
+
+        with self.subTest('print'):
+            calc_rel_humid = humidity.absolute_to_relative(np.array([10.0, 20.0]), 30.0)
+
+            self.assertEqual(str(calc_rel_humid), '[32.9407 65.8814] %')
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -6,55 +6,72 @@ from gasify import unit
 
 from tests.util import QuantityTestCase
 
+_degC = unit.registry.degC
+_degK = unit.registry.degK
+_kelvin = unit.registry.kelvin
+_meter = unit.registry.meter
+_millimeter = unit.registry.millimeter
+_kilometer = unit.registry.kilometer
+_ohm = unit.registry.ohm
+_kiloohm = unit.registry.kiloohm
+_megaohm = unit.registry.megaohm
+_mohm = unit.registry.mohm
+_V = unit.registry.V
+_mV = unit.registry.mV
+_volt = unit.registry.volt
+_ppb = unit.registry.ppb
+_ppm = unit.registry.ppm
+_percent = unit.registry.percent
+
 
 class FunctionTestCase(QuantityTestCase):
     def test_scale(self):
         self.assertQuantity(
-            unit.Quantity(1000, unit.registry.ohm).to_compact(),
-            unit.Quantity(1, unit.registry.kiloohm)
+            unit.Quantity(1000, _ohm).to_compact(),
+            unit.Quantity(1, _kiloohm)
         )
 
         self.assertQuantity(
-            unit.Quantity(1000000, unit.registry.ohm).to_compact(),
-            unit.Quantity(1, unit.registry.megaohm)
+            unit.Quantity(1000000, _ohm).to_compact(),
+            unit.Quantity(1, _megaohm)
         )
 
         self.assertQuantity(
-            unit.Quantity(1000000, unit.registry.ohm).to(unit.registry.kiloohm),
-            unit.Quantity(1000, unit.registry.kiloohm)
+            unit.Quantity(1000000, _ohm).to(_kiloohm),
+            unit.Quantity(1000, _kiloohm)
         )
 
     def test_str_mixed_unit_per(self):
-        self.assertEqual('1 Ω/m', str(unit.Quantity(1, unit.registry.ohm / unit.registry.meter)))
-        self.assertEqual('1 kΩ/m', str(unit.Quantity(1, unit.registry.ohm / unit.registry.millimeter)))
-        self.assertEqual('1 kΩ/m', str(unit.Quantity(1, unit.registry.kiloohm / unit.registry.meter)))
+        self.assertEqual('1 Ω/m', str(unit.Quantity(1, _ohm / _meter)))
+        self.assertEqual('1 kΩ/m', str(unit.Quantity(1, _ohm / _millimeter)))
+        self.assertEqual('1 kΩ/m', str(unit.Quantity(1, _kiloohm / _meter)))
 
     def test_str_mixed_unit_product(self):
-        self.assertEqual('1 m Ω', str(unit.Quantity(1, unit.registry.ohm * unit.registry.meter)))
-        self.assertEqual('1 kΩ m', str(unit.Quantity(1, unit.registry.kiloohm * unit.registry.meter)))
-        self.assertEqual('1 m mΩ', str(unit.Quantity(1, unit.registry.ohm * unit.registry.millimeter)))
+        self.assertEqual('1 m Ω', str(unit.Quantity(1, _ohm * _meter)))
+        self.assertEqual('1 kΩ m', str(unit.Quantity(1, _kiloohm * _meter)))
+        self.assertEqual('1 m mΩ', str(unit.Quantity(1, _ohm * _millimeter)))
 
 
 class ParseTestCase(QuantityTestCase):
     def _testParseList(self, test_list: Iterable[Tuple[unit.TParseQuantity, Optional[unit.TParseUnit], unit.Quantity,
                                                        Optional[int]]], mag_round: Optional[int] = None):
         for test_in, test_unit, expected_qty, places in test_list:
-            with self.subTest(f"Input: {test_in!r}, Unit: {test_unit or 'no unit'} = {expected_qty!s} "
-                              f"(places: {places}, round: {mag_round})"):
+            # Parameters are only formatted when a subtest fails
+            with self.subTest(input=test_in, unit=test_unit, expected=expected_qty, places=places, round=mag_round):
                 self.assertQuantity(unit.parse(test_in, test_unit, mag_round), expected_qty, places)
 
     def test_parse_unit(self):
-        self.assertEqual(unit.registry.degK, unit.parse_unit('K'))
-        self.assertEqual(unit.registry.degK, unit.parse_unit('kelvin'))
-        self.assertEqual(unit.registry.degK, unit.parse_unit(unit.registry.kelvin))
-        self.assertEqual(unit.registry.degK, unit.parse_unit(unit.Quantity(1, unit.registry.kelvin)))
+        self.assertEqual(_degK, unit.parse_unit('K'))
+        self.assertEqual(_degK, unit.parse_unit('kelvin'))
+        self.assertEqual(_degK, unit.parse_unit(_kelvin))
+        self.assertEqual(_degK, unit.parse_unit(unit.Quantity(1, _kelvin)))
 
-        self.assertEqual(unit.registry.degC, unit.parse_unit('degC'))
-        self.assertEqual(unit.registry.degC, unit.parse_unit('°C'))
+        self.assertEqual(_degC, unit.parse_unit('degC'))
+        self.assertEqual(_degC, unit.parse_unit('°C'))
 
-        self.assertEqual(unit.registry.meter, unit.parse_unit('m'))
-        self.assertEqual(unit.registry.millimeter, unit.parse_unit('mm'))
-        self.assertEqual(unit.registry.kilometer, unit.parse_unit('km'))
+        self.assertEqual(_meter, unit.parse_unit('m'))
+        self.assertEqual(_millimeter, unit.parse_unit('mm'))
+        self.assertEqual(_kilometer, unit.parse_unit('km'))
 
     def test_parse_dimensionless(self):
         self._testParseList([
@@ -103,39 +120,63 @@ class ParseTestCase(QuantityTestCase):
 
     def test_parse_provide_unit(self):
         self._testParseList([
-            ('0.001', unit.registry.degC, unit.Quantity(0.001, unit.registry.degC), None),
-            (0.001, unit.registry.degC, unit.Quantity(0.001, unit.registry.degC), None),
+            ('0.001', _degC, unit.Quantity(0.001, _degC), None),
+            (0.001, _degC, unit.Quantity(0.001, _degC), None),
 
-            ('1', unit.registry.degC, unit.Quantity(1.0, unit.registry.degC), None),
-            ('1.0', unit.registry.degC, unit.Quantity(1.0, unit.registry.degC), None),
-            (1, unit.registry.degC, unit.Quantity(1.0, unit.registry.degC), None),
-            (1.0, unit.registry.degC, unit.Quantity(1.0, unit.registry.degC), None),
+            ('1', _degC, unit.Quantity(1.0, _degC), None),
+            ('1.0', _degC, unit.Quantity(1.0, _degC), None),
+            (1, _degC, unit.Quantity(1.0, _degC), None),
+            (1.0, _degC, unit.Quantity(1.0, _degC), None),
 
-            ('1000', unit.registry.degC, unit.Quantity(1000.0, unit.registry.degC), None),
-            ('1000.0', unit.registry.degC, unit.Quantity(1000.0, unit.registry.degC), None),
-            (1000, unit.registry.degC, unit.Quantity(1000.0, unit.registry.degC), None),
-            (1000.0, unit.registry.degC, unit.Quantity(1000.0, unit.registry.degC), None),
+            ('1000', _degC, unit.Quantity(1000.0, _degC), None),
+            ('1000.0', _degC, unit.Quantity(1000.0, _degC), None),
+            (1000, _degC, unit.Quantity(1000.0, _degC), None),
+            (1000.0, _degC, unit.Quantity(1000.0, _degC), None),
 
-            ('1.0°C', None, unit.Quantity(1.0, unit.registry.degC), None),
-            ('1.0°C', unit.registry.degC, unit.Quantity(1.0, unit.registry.degC), None),
+            ('1.0°C', None, unit.Quantity(1.0, _degC), None),
+            ('1.0°C', _degC, unit.Quantity(1.0, _degC), None),
 
-            (unit.Quantity(1.0, unit.registry.degC), None, unit.Quantity(1.0, unit.registry.degC), None),
-            (unit.Quantity(1.0, unit.registry.degC), unit.registry.degC, unit.Quantity(1.0, unit.registry.degC), None)
+            (unit.Quantity(1.0, _degC), None, unit.Quantity(1.0, _degC), None),
+            (unit.Quantity(1.0, _degC), _degC, unit.Quantity(1.0, _degC), None)
         ])
 
     def test_parse_mixed_scale(self):
         self._testParseList([
-            ('1m', unit.registry.millimeter, unit.Quantity(1000.0, unit.registry.millimeter), None),
-            (unit.Quantity(1.0, unit.registry.meter), unit.registry.millimeter,
-             unit.Quantity(1000.0, unit.registry.millimeter), None)
+            ('1m', _millimeter, unit.Quantity(1000.0, _millimeter), None),
+            (unit.Quantity(1.0, _meter), _millimeter,
+             unit.Quantity(1000.0, _millimeter), None)
         ])
 
     def test_parse_mixed_unit(self):
         self._testParseList([
-            ('1 Ω m', None, unit.Quantity(1.0, unit.registry.ohm * unit.registry.meter), None),
-            ('1 Ω/m', None, unit.Quantity(1.0, unit.registry.ohm / unit.registry.meter), None)
+            ('1 Ω m', None, unit.Quantity(1.0, _ohm * _meter), None),
+            ('1 Ω/m', None, unit.Quantity(1.0, _ohm / _meter), None)
         ])
 
+    def test_parse_repeat(self):
+        x = unit.parse('1 m')
+        x.ito(_millimeter)
+
+        self.assertQuantity(unit.parse('1 m'), unit.Quantity(1.0, _meter))
+
+        x = unit.parse('1 m', _millimeter)
+        x.ito(_meter)
+
+        self.assertQuantity(unit.parse('1 m', _millimeter),
+                            unit.Quantity(1000.0, _millimeter))
+
+    def test_parse_copy(self):
+        x = unit.Quantity(5.0, _mohm)
+
+        self.assertIsNot(unit.parse(x, x.units), x)
+
+        @unit.return_converter(_ohm)
+        def f(y):
+            return unit.parse(y, _mohm)
+
+        self.assertQuantity(f(x), unit.Quantity(0.005, _ohm))
+        self.assertQuantity(x, unit.Quantity(5.0, _mohm))
+
     # noinspection PyTypeChecker
     def test_parse_invalid(self):
         with self.assertRaises(unit.ParseError):
@@ -152,7 +193,10 @@ class ParseTestCase(QuantityTestCase):
 
     def test_parse_invalid_conversion(self):
         with self.assertRaises(unit.IncompatibleUnits):
-            unit.parse('1 degC', unit.registry.volt)
+            unit.parse('1 degC', _volt)
+
+        with self.assertRaisesRegex(unit.IncompatibleUnits, r'to units m$'):
+            unit.parse('1 V', _meter)
 
     def test_parse_unit_invalid(self):
         # noinspection PyTypeChecker
@@ -164,75 +208,96 @@ class ParseTestCase(QuantityTestCase):
 
     def test_parse_magnitude(self):
         self.assertEqual(1.0, unit.parse_magnitude(1.0))
-        self.assertEqual(1000.0, unit.parse_magnitude('1 V', unit.registry.mV))
-        self.assertEqual(1000.0, unit.parse_magnitude(1, unit.registry.mV, unit.registry.V))
+        self.assertEqual(1000.0, unit.parse_magnitude('1 V', _mV))
+        self.assertEqual(1000.0, unit.parse_magnitude(1, _mV, _V))
+        self.assertEqual(1.0, unit.parse_magnitude(unit.Quantity(1.0, _mV), _mV))
+        self.assertEqual(2.0, unit.parse_magnitude(2, _mV))
+
+        x = unit.parse_magnitude(unit.Quantity(1, _mV), _mV)
+        self.assertIsInstance(x, float)
+        self.assertEqual(1.0, x)
+
+        x = unit.parse_magnitude(unit.Quantity(1, _mV), _mV, _V)
+        self.assertIsInstance(x, float)
+        self.assertEqual(1.0, x)
+
+        with self.assertRaises(unit.IncompatibleUnits):
+            unit.parse_magnitude(unit.Quantity(1, _mV), _mV, _meter)
+
+        self.assertEqual(1.0, unit.parse_magnitude(unit.Quantity(1, _meter), 'm', 'km'))
+        self.assertEqual(1.0, unit.parse_magnitude(unit.Quantity(1, _meter), 'm', 'm'))
 
 
 class PrintingTestCase(unittest.TestCase):
     def assertStr(self, test_set):
-        for qty, qty_str in test_set:
-            with self.subTest(f"{qty!r} == {qty_str!r}"):
-                self.assertEqual(qty_str, str(qty))
+        # Compare as a single list, unittest reports the differing entries on failure
+        self.assertListEqual([qty_str for _, qty_str in test_set], [str(qty) for qty, _ in test_set])
 
     def test_print_single(self):
         self.assertStr([
-            (unit.Quantity(0.001, unit.registry.meter), '1 mm'),
-            (unit.Quantity(1, unit.registry.millimeter), '1 mm'),
-            (unit.Quantity(0.01, unit.registry.meter), '10 mm'),
-            (unit.Quantity(10, unit.registry.millimeter), '10 mm'),
-            (unit.Quantity(0.1, unit.registry.meter), '100 mm'),
-            (unit.Quantity(100, unit.registry.millimeter), '100 mm'),
-            (unit.Quantity(1, unit.registry.meter), '1 m'),
-            (unit.Quantity(1000, unit.registry.millimeter), '1 m'),
-
-            (unit.Quantity(10, unit.registry.meter), '10 m'),
-            (unit.Quantity(100, unit.registry.meter), '100 m'),
-            (unit.Quantity(1000, unit.registry.meter), '1 km')
+            (unit.Quantity(0.001, _meter), '1 mm'),
+            (unit.Quantity(1, _millimeter), '1 mm'),
+            (unit.Quantity(0.01, _meter), '10 mm'),
+            (unit.Quantity(10, _millimeter), '10 mm'),
+            (unit.Quantity(0.1, _meter), '100 mm'),
+            (unit.Quantity(100, _millimeter), '100 mm'),
+            (unit.Quantity(1, _meter), '1 m'),
+            (unit.Quantity(1000, _millimeter), '1 m'),
+
+            (unit.Quantity(10, _meter), '10 m'),
+            (unit.Quantity(100, _meter), '100 m'),
+            (unit.Quantity(1000, _meter), '1 km')
         ])
 
     def test_print_limit(self):
-        self.assertEqual(str(unit.Quantity(1000000, unit.registry.meter)), '1000 km')
+        self.assertEqual(str(unit.Quantity(1000000, _meter)), '1000 km')
 
     def test_print_dimensionless(self):
         self.assertStr([
-            (unit.Quantity(1, unit.registry.ppb), '1 ppb'),
-            (unit.Quantity(10, unit.registry.ppb), '10 ppb'),
-            (unit.Quantity(100, unit.registry.ppb), '100 ppb'),
-            (unit.Quantity(1000, unit.registry.ppb), '1 ppm'),
-            (unit.Quantity(10000, unit.registry.ppb), '10 ppm'),
-            (unit.Quantity(100000, unit.registry.ppb), '100 ppm'),
-            (unit.Quantity(1000000, unit.registry.ppb), '0.1%'),
-            (unit.Quantity(10000000, unit.registry.ppb), '1%'),
-            (unit.Quantity(100000000, unit.registry.ppb), '10%'),
-            (unit.Quantity(1000000000, unit.registry.ppb), '100%'),
-
-            (unit.Quantity(0.001, unit.registry.ppm), '1 ppb'),
-            (unit.Quantity(0.01, unit.registry.ppm), '10 ppb'),
-            (unit.Quantity(0.1, unit.registry.ppm), '100 ppb'),
-            (unit.Quantity(1, unit.registry.ppm), '1 ppm'),
-            (unit.Quantity(10, unit.registry.ppm), '10 ppm'),
-            (unit.Quantity(100, unit.registry.ppm), '100 ppm'),
-            (unit.Quantity(1000, unit.registry.ppm), '0.1%'),
-            (unit.Quantity(10000, unit.registry.ppm), '1%'),
-            (unit.Quantity(100000, unit.registry.ppm), '10%'),
-            (unit.Quantity(1000000, unit.registry.ppm), '100%'),
-
-            (unit.Quantity(0.0000001, unit.registry.percent), '1 ppb'),
-            (unit.Quantity(0.000001, unit.registry.percent), '10 ppb'),
-            (unit.Quantity(0.00001, unit.registry.percent), '100 ppb'),
-            (unit.Quantity(0.0001, unit.registry.percent), '1 ppm'),
-            (unit.Quantity(0.001, unit.registry.percent), '10 ppm'),
-            (unit.Quantity(0.01, unit.registry.percent), '100 ppm'),
-            (unit.Quantity(0.1, unit.registry.percent), '0.1%'),
-            (unit.Quantity(1, unit.registry.percent), '1%'),
-            (unit.Quantity(10, unit.registry.percent), '10%'),
-            (unit.Quantity(100, unit.registry.percent), '100%')
+            (unit.Quantity(1, _ppb), '1 ppb'),
+            (unit.Quantity(10, _ppb), '10 ppb'),
+            (unit.Quantity(100, _ppb), '100 ppb'),
+            (unit.Quantity(1000, _ppb), '1 ppm'),
+            (unit.Quantity(10000, _ppb), '10 ppm'),
+            (unit.Quantity(100000, _ppb), '100 ppm'),
+            (unit.Quantity(1000000, _ppb), '0.1%'),
+            (unit.Quantity(10000000, _ppb), '1%'),
+            (unit.Quantity(100000000, _ppb), '10%'),
+            (unit.Quantity(1000000000, _ppb), '100%'),
+
+            (unit.Quantity(0.001, _ppm), '1 ppb'),
+            (unit.Quantity(0.01, _ppm), '10 ppb'),
+            (unit.Quantity(0.1, _ppm), '100 ppb'),
+            (unit.Quantity(1, _ppm), '1 ppm'),
+            (unit.Quantity(10, _ppm), '10 ppm'),
+            (unit.Quantity(100, _ppm), '100 ppm'),
+            (unit.Quantity(1000, _ppm), '0.1%'),
+            (unit.Quantity(10000, _ppm), '1%'),
+            (unit.Quantity(100000, _ppm), '10%'),
+            (unit.Quantity(1000000, _ppm), '100%'),
+
+            (unit.Quantity(0.0000001, _percent), '1 ppb'),
+            (unit.Quantity(0.000001, _percent), '10 ppb'),
+            (unit.Quantity(0.00001, _percent), '100 ppb'),
+            (unit.Quantity(0.0001, _percent), '1 ppm'),
+            (unit.Quantity(0.001, _percent), '10 ppm'),
+            (unit.Quantity(0.01, _percent), '100 ppm'),
+            (unit.Quantity(0.1, _percent), '0.1%'),
+            (unit.Quantity(1, _percent), '1%'),
+            (unit.Quantity(10, _percent), '10%'),
+            (unit.Quantity(100, _percent), '100%')
+        ])
+
+    def test_print_nan(self):
+        self.assertStr([
+            (unit.Quantity(float('nan'), _percent), 'nan%'),
+            (unit.Quantity(float('nan'), _ppm), 'nan ppm'),
+            (unit.Quantity(float('nan'), _ppb), 'nan ppb')
         ])
 
     def test_print_plus_minus(self):
-        self.assertEqual(str(unit.Quantity(1, unit.registry.V).plus_minus(0.1)), '1±0.1 V')
-        self.assertEqual(str(unit.Quantity(1.001, unit.registry.V).plus_minus(0.1)), '1.001±0.1 V')
-        self.assertEqual(str(unit.Quantity(1.001, unit.registry.V).plus_minus(0.1)), '1.001±0.1 V')
+        self.assertEqual(str(unit.Quantity(1, _V).plus_minus(0.1)), '1±0.1 V')
+        self.assertEqual(str(unit.Quantity(1.001, _V).plus_minus(0.1)), '1.001±0.1 V')
 
 
 class TimeDeltaTestCase(unittest.TestCase):
@@ -256,23 +321,27 @@ class TimeDeltaTestCase(unittest.TestCase):
 
 class ConverterTestCase(QuantityTestCase):
     def test_converter(self):
-        converter = unit.converter(unit.registry.ohm)
-        optional_converter = unit.converter(unit.registry.ohm, True)
+        converter = unit.converter(_ohm)
+        optional_converter = unit.converter(_ohm, True)
 
-        self.assertQuantity(converter('1 ohm'), unit.Quantity(1, unit.registry.ohm))
-        self.assertQuantity(converter(1), unit.Quantity(1, unit.registry.ohm))
-        self.assertQuantity(converter(1.0), unit.Quantity(1, unit.registry.ohm))
+        self.assertQuantity(converter('1 ohm'), unit.Quantity(1, _ohm))
+        self.assertQuantity(converter(1), unit.Quantity(1, _ohm))
+        self.assertQuantity(converter(1.0), unit.Quantity(1, _ohm))
 
         with self.assertRaises(unit.ParseError):
             converter(None)
 
-        self.assertQuantity(optional_converter('1 ohm'), unit.Quantity(1, unit.registry.ohm))
-        self.assertQuantity(optional_converter(1), unit.Quantity(1, unit.registry.ohm))
-        self.assertQuantity(optional_converter(1.0), unit.Quantity(1, unit.registry.ohm))
+        self.assertQuantity(optional_converter('1 ohm'), unit.Quantity(1, _ohm))
+        self.assertQuantity(optional_converter(1), unit.Quantity(1, _ohm))
+        self.assertQuantity(optional_converter(1.0), unit.Quantity(1, _ohm))
         self.assertIsNone(optional_converter(None))
 
+        x = unit.Quantity(1.0, _ohm)
+        self.assertIsNot(converter(x), x)
+        self.assertQuantity(converter(x), x)
+
     def test_return(self):
-        @unit.return_converter(unit.registry.ohm)
+        @unit.return_converter(_ohm)
         def test_method_a():
             return 1
 
@@ -280,16 +349,16 @@ class ConverterTestCase(QuantityTestCase):
         def test_method_b():
             return 1
 
-        @unit.return_converter(unit.registry.ohm, True)
+        @unit.return_converter(_ohm, True)
         def test_method_c():
             return None
 
-        @unit.return_converter(unit.registry.ohm)
+        @unit.return_converter(_ohm)
         def test_method_d():
             return None
 
-        self.assertQuantity(test_method_a(), unit.Quantity(1, unit.registry.ohm))
-        self.assertQuantity(test_method_b(), unit.Quantity(1, unit.registry.ohm))
+        self.assertQuantity(test_method_a(), unit.Quantity(1, _ohm))
+        self.assertQuantity(test_method_b(), unit.Quantity(1, _ohm))
 
         self.assertIsNone(test_method_c())
 
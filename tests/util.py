@@ -9,7 +9,11 @@ class QuantityTestCase(TestCase):
                        magnitude_unit: Optional[Unit] = None):
         self.assertIsInstance(x, Quantity, 'Not an instance of Quantity')
 
-        if magnitude_unit is not None:
+        if magnitude_unit is not None and x.units == magnitude_unit and expected.units == magnitude_unit:
+            # Already in the requested unit, no conversion required
+            x_mag = x.magnitude
+            expected_mag = expected.magnitude
+        elif magnitude_unit is not None:
             self.assertTrue(x.is_compatible_with(expected.units), 'Incompatible units')
             x_mag = x.m_as(magnitude_unit)
             expected_mag = expected.m_as(magnitude_unit)